@@ -33,13 +33,20 @@ Version: 2.0.0
 Date: 2026-01-20
 """
 
+import ctypes
+import inspect
+import mmap
 import os
+import plistlib
+import re
+import subprocess
 import sys
 import struct
 import platform
 import logging
+import queue
+import threading
 import time
-import json
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, List, Callable, BinaryIO, Tuple
@@ -69,6 +76,31 @@ SECTOR_SIZE = 512
 # GPT Partition GUID for Microsoft Basic Data
 GPT_MSDATA_GUID = b'\xA2\xA0\xD0\xEB\xE5\xB9\x33\x44\x87\xC0\x68\xB6\xB7\x26\x99\xC7'
 
+# Precompiled header-field readers — parsing the '<I'/'<Q' format strings
+# once at module load avoids the per-call format parse and the data[a:b]
+# slice allocation that struct.unpack(fmt, slice) needs.
+_u32 = struct.Struct('<I')
+_u64 = struct.Struct('<Q')
+
+# One Struct covering the whole fixed-layout XCI region 0x104..0x187
+# (little-endian, no padding): secure/backup area, the four size/flag
+# bytes, package id, valid data end, IV, HFS0 offset/size, the two
+# hashes, the three mode/key flags, normal area end. One unpack_from
+# call replaces ~12 independent ones.
+_XCI_FIELDS = struct.Struct('<II4BQQ16sQQ32s32s3BI')
+
+# The GUID packed into two machine words at import time: a partition-
+# entry scan then compares two ints per entry instead of allocating a
+# 16-byte slice for a bytes compare.
+_GPT_MSDATA_LO = int.from_bytes(GPT_MSDATA_GUID[:8], 'little')
+_GPT_MSDATA_HI = int.from_bytes(GPT_MSDATA_GUID[8:], 'little')
+
+
+def is_msdata_guid(entry, offset: int = 0) -> bool:
+    """True if the GPT entry at `offset` carries the MS Basic Data GUID"""
+    return (_u64.unpack_from(entry, offset)[0] == _GPT_MSDATA_LO and
+            _u64.unpack_from(entry, offset + 8)[0] == _GPT_MSDATA_HI)
+
 # Memory Map (from migupdater.py analysis)
 class MemoryMap:
     """MIG-Flash Memory Layout"""
@@ -183,31 +215,44 @@ class XCIHeader:
     normal_area_end: int
     
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'XCIHeader':
-        """Parse XCI header from raw bytes"""
+    def from_bytes(cls, data) -> 'XCIHeader':
+        """Parse XCI header from raw bytes (bytes/bytearray/memoryview).
+        
+        Stored byte fields are copied out via bytes() so the header owns
+        immutable data even when parsing from a reused read buffer.
+        """
         if len(data) < 0x200:
             raise ValueError("XCI header too short")
-        
+
+        (secure_area_start, backup_area_start,
+         title_key_dec_index, game_card_size,
+         game_card_header_version, game_card_flags,
+         package_id, valid_data_end, iv,
+         hfs0_partition_offset, hfs0_header_size,
+         sha256_hash, init_data_hash,
+         secure_mode_flag, title_key_flag, key_flag,
+         normal_area_end) = _XCI_FIELDS.unpack_from(data, 0x104)
+
         return cls(
-            signature=data[0x000:0x100],
-            magic=data[0x100:0x104],
-            secure_area_start=struct.unpack('<I', data[0x104:0x108])[0],
-            backup_area_start=struct.unpack('<I', data[0x108:0x10C])[0],
-            title_key_dec_index=data[0x10C],
-            game_card_size=data[0x10D],
-            game_card_header_version=data[0x10E],
-            game_card_flags=data[0x10F],
-            package_id=struct.unpack('<Q', data[0x110:0x118])[0],
-            valid_data_end=struct.unpack('<Q', data[0x118:0x120])[0],
-            iv=data[0x120:0x130],
-            hfs0_partition_offset=struct.unpack('<Q', data[0x130:0x138])[0],
-            hfs0_header_size=struct.unpack('<Q', data[0x138:0x140])[0],
-            sha256_hash=data[0x140:0x160],
-            init_data_hash=data[0x160:0x180],
-            secure_mode_flag=data[0x180],
-            title_key_flag=data[0x181],
-            key_flag=data[0x182],
-            normal_area_end=struct.unpack('<I', data[0x183:0x187])[0]
+            signature=bytes(data[0x000:0x100]),
+            magic=bytes(data[0x100:0x104]),
+            secure_area_start=secure_area_start,
+            backup_area_start=backup_area_start,
+            title_key_dec_index=title_key_dec_index,
+            game_card_size=game_card_size,
+            game_card_header_version=game_card_header_version,
+            game_card_flags=game_card_flags,
+            package_id=package_id,
+            valid_data_end=valid_data_end,
+            iv=iv,
+            hfs0_partition_offset=hfs0_partition_offset,
+            hfs0_header_size=hfs0_header_size,
+            sha256_hash=sha256_hash,
+            init_data_hash=init_data_hash,
+            secure_mode_flag=secure_mode_flag,
+            title_key_flag=title_key_flag,
+            key_flag=key_flag,
+            normal_area_end=normal_area_end
         )
     
     @property
@@ -242,24 +287,56 @@ def is_linux() -> bool:
     return platform.system() == 'Linux'
 
 
+# Windows modules and the kernel32 prototype setup happen exactly once
+# at load: per-call imports still take the import lock on every
+# discovery pass, and reassigning argtypes/restype each call is wasted
+# work.
+if is_windows():
+    import win32file
+    import win32con
+    import win32api
+    import win32event
+    import winioctlcon
+    from ctypes import wintypes
+
+    _KERNEL32 = ctypes.WinDLL('kernel32')
+    _KERNEL32.FindFirstVolumeW.restype = wintypes.HANDLE
+    _KERNEL32.FindNextVolumeW.argtypes = (
+        wintypes.HANDLE, wintypes.LPWSTR, wintypes.DWORD)
+    _KERNEL32.FindVolumeClose.argtypes = (wintypes.HANDLE,)
+else:
+    _KERNEL32 = None
+
+
 class BlockDevice:
     """
     Platform-independent block device access.
     Provides raw sector read/write to USB storage devices.
     """
     
-    def __init__(self, device_path: str):
+    def __init__(self, device_path: str, direct: bool = False):
         self.device_path = device_path
         self.handle = None
+        self._fd = -1
         self._opened = False
+        # O_DIRECT bulk-read mode (Linux only, opt-in): GB-scale dumps
+        # bypass the page cache so they neither pollute it nor pay the
+        # extra kernel→cache→user copy. Needs 512-byte-aligned I/O, so
+        # direct reads bounce through a page-aligned mmap buffer and
+        # get sliced to the requested window.
+        self._direct = direct
+        self._direct_buf = None
         
-        # Platform-specific imports
+        # Current file position for the seek/read API. Windows keeps
+        # this in userspace because the overlapped handle has no file
+        # pointer; Unix delegates to the OS offset.
+        self._pos = 0
+        
+        # Bound from the module-level platform imports
         if is_windows():
-            import win32file
-            import win32con
-            import winioctlcon
             self._win32file = win32file
             self._win32con = win32con
+            self._win32event = win32event
             self._winioctlcon = winioctlcon
     
     def open(self):
@@ -276,7 +353,15 @@ class BlockDevice:
         logger.debug(f"Opened device: {self.device_path}")
     
     def _open_windows(self):
-        """Open device on Windows"""
+        """Open device on Windows
+        
+        The handle is opened FILE_FLAG_OVERLAPPED so several ReadFile
+        requests can be in flight at once (see read_many); plain reads
+        go through the same path with a single OVERLAPPED and a
+        blocking wait. FILE_FLAG_NO_BUFFERING is deliberately NOT set:
+        it forces sector-aligned sizes, and the probe paths issue small
+        unaligned header reads.
+        """
         access = self._win32con.GENERIC_READ | self._win32con.GENERIC_WRITE
         share = self._win32con.FILE_SHARE_READ | self._win32con.FILE_SHARE_WRITE
         
@@ -286,7 +371,8 @@ class BlockDevice:
             share,
             None,
             self._win32con.OPEN_EXISTING,
-            self._win32con.FILE_ATTRIBUTE_NORMAL,
+            self._win32con.FILE_ATTRIBUTE_NORMAL |
+            self._win32file.FILE_FLAG_OVERLAPPED,
             None
         )
         
@@ -304,7 +390,6 @@ class BlockDevice:
         """Open device on Unix/Mac"""
         if is_mac():
             # Unmount on Mac first
-            import subprocess
             try:
                 subprocess.run(
                     ["diskutil", "unmountDisk", "force", self.device_path],
@@ -314,7 +399,18 @@ class BlockDevice:
             except:
                 pass
         
+        if self._direct and is_linux():
+            try:
+                fd = os.open(self.device_path, os.O_RDWR | os.O_DIRECT)
+                self.handle = os.fdopen(fd, 'r+b', buffering=0)
+                self._fd = fd
+                return
+            except OSError as e:
+                # Some USB mass-storage drivers refuse O_DIRECT
+                logger.debug(f"O_DIRECT unavailable ({e}), using cached I/O")
+                self._direct = False
         self.handle = open(self.device_path, 'r+b', buffering=0)
+        self._fd = self.handle.fileno()
     
     def close(self):
         """Close device"""
@@ -334,31 +430,47 @@ class BlockDevice:
         else:
             self.handle.close()
         
+        if self._direct_buf is not None:
+            self._direct_buf.close()
+            self._direct_buf = None
         self.handle = None
+        self._fd = -1
         self._opened = False
         logger.debug(f"Closed device: {self.device_path}")
     
+    def _overlapped(self, offset: int):
+        """Build an OVERLAPPED for one positioned Windows I/O"""
+        ov = self._win32file.OVERLAPPED()
+        ov.Offset = offset & 0xFFFFFFFF
+        ov.OffsetHigh = offset >> 32
+        ov.hEvent = self._win32event.CreateEvent(None, True, False, None)
+        return ov
+    
     def seek(self, offset: int):
         """Seek to absolute offset"""
         if is_windows():
-            self._win32file.SetFilePointer(
-                self.handle, offset, self._win32con.FILE_BEGIN
-            )
+            self._pos = offset
         else:
             self.handle.seek(offset)
     
     def read(self, size: int) -> bytes:
         """Read bytes from current position"""
         if is_windows():
-            _, data = self._win32file.ReadFile(self.handle, size, None)
-            return bytes(data)
+            ov = self._overlapped(self._pos)
+            _, buf = self._win32file.ReadFile(self.handle, size, ov)
+            n = self._win32file.GetOverlappedResult(self.handle, ov, True)
+            self._pos += n
+            return bytes(buf[:n])
         else:
             return self.handle.read(size)
     
     def write(self, data: bytes):
         """Write bytes to current position"""
         if is_windows():
-            self._win32file.WriteFile(self.handle, data, None)
+            ov = self._overlapped(self._pos)
+            self._win32file.WriteFile(self.handle, data, ov)
+            n = self._win32file.GetOverlappedResult(self.handle, ov, True)
+            self._pos += n
         else:
             self.handle.write(data)
     
@@ -374,11 +486,139 @@ class BlockDevice:
         self.seek(sector * SECTOR_SIZE)
         self.write(data)
     
+    def _read_direct(self, offset: int, size: int) -> bytes:
+        """Sector-aligned O_DIRECT read, sliced to the requested window"""
+        a_off = offset & ~(SECTOR_SIZE - 1)
+        a_len = (offset + size - a_off + SECTOR_SIZE - 1) & ~(SECTOR_SIZE - 1)
+        if self._direct_buf is None or len(self._direct_buf) < a_len:
+            if self._direct_buf is not None:
+                self._direct_buf.close()
+            # Anonymous mmap is page-aligned, satisfying O_DIRECT's
+            # buffer-alignment requirement.
+            self._direct_buf = mmap.mmap(-1, a_len)
+        mv = memoryview(self._direct_buf)
+        n = os.preadv(self._fd, [mv[:a_len]], a_off)
+        lo = offset - a_off
+        return bytes(mv[lo:lo + min(size, max(0, n - lo))])
+    
     def read_at(self, offset: int, size: int) -> bytes:
         """Read bytes from specific offset"""
+        if not is_windows():
+            if self._direct:
+                return self._read_direct(offset, size)
+            # One pread syscall instead of the seek+read pair.
+            return os.pread(self._fd, size, offset)
         self.seek(offset)
         return self.read(size)
     
+    def read_range(self, start_sector: int, n_sectors: int) -> bytes:
+        """Read n_sectors consecutive sectors with as few requests as
+        possible.
+        
+        Sequential scans that loop read_sector pay one (or two) syscalls
+        per 512 bytes; USB mass storage charges per request, not per
+        byte, so this issues at most 1 MiB per read instead.
+        """
+        total = n_sectors * SECTOR_SIZE
+        max_read = 1024 * 1024
+        if total <= max_read:
+            return self.read_at(start_sector * SECTOR_SIZE, total)
+        
+        parts = []
+        offset = start_sector * SECTOR_SIZE
+        remaining = total
+        while remaining > 0:
+            n = min(max_read, remaining)
+            parts.append(self.read_at(offset, n))
+            offset += n
+            remaining -= n
+        return b''.join(parts)
+    
+    def read_into(self, offset: int, buf) -> int:
+        """Read len(buf) bytes at offset directly into a caller-supplied
+        buffer (bytearray/memoryview).
+        
+        On Unix this is a single preadv syscall with no intermediate
+        bytes allocation, so a dump loop can reuse one preallocated
+        buffer instead of churning a fresh bytes object per chunk.
+        Returns the number of bytes read.
+        """
+        if is_windows() or self._direct:
+            data = self.read_at(offset, len(buf))
+            n = len(data)
+            buf[:n] = data
+            return n
+        return os.preadv(self._fd, [buf], offset)
+    
+    def advise_sequential(self):
+        """Hint the kernel that a forward scan follows (Linux readahead)"""
+        if hasattr(os, 'posix_fadvise') and self._fd >= 0:
+            try:
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # advisory only
+
+    def copy_range(self, src_off: int, length: int, out_fd: int,
+                   chunk_size: int = 4 * 1024 * 1024,
+                   progress: Optional[Callable[[int], None]] = None) -> int:
+        """Copy `length` bytes at `src_off` into `out_fd` kernel-side.
+
+        os.sendfile moves pages directly from the device's page cache
+        into the output file — no kernel→user→kernel bounce, no Python
+        bytes objects. Each chunk is preceded by a POSIX_FADV_WILLNEED
+        hint for the next window so the readahead stays primed. Raises
+        OSError where sendfile can't serve this fd pair (e.g. macOS
+        restricts it to sockets); callers fall back to buffered reads.
+        Returns the number of bytes copied.
+        """
+        if not hasattr(os, 'sendfile'):
+            raise OSError("os.sendfile not available on this platform")
+        fd = self._fd
+        fadvise = getattr(os, 'posix_fadvise', None)
+        copied = 0
+        while copied < length:
+            n = min(chunk_size, length - copied)
+            if fadvise is not None:
+                ahead = min(chunk_size, length - copied - n)
+                if ahead > 0:
+                    try:
+                        fadvise(fd, src_off + copied + n, ahead,
+                                os.POSIX_FADV_WILLNEED)
+                    except OSError:
+                        fadvise = None
+            sent = os.sendfile(out_fd, fd, src_off + copied, n)
+            if sent == 0:
+                raise IOError(f"short copy at offset {src_off + copied}")
+            copied += sent
+            if progress:
+                progress(copied)
+        return copied
+
+    def read_many(self, offsets, size: int) -> List[bytes]:
+        """Read equal-sized blocks at several offsets.
+        
+        On Windows the requests are posted together on the overlapped
+        handle, so the USB storage stack sees them all at once and the
+        per-request latency overlaps instead of summing. Results come
+        back in offset-argument order. Unix issues sequential preads —
+        the syscall itself is cheap there and the mass-storage bridge
+        serializes anyway.
+        """
+        if not is_windows():
+            return [self.read_at(off, size) for off in offsets]
+        
+        pending = []
+        for off in offsets:
+            ov = self._overlapped(off)
+            _, buf = self._win32file.ReadFile(self.handle, size, ov)
+            pending.append((ov, buf))
+        
+        results = []
+        for ov, buf in pending:
+            n = self._win32file.GetOverlappedResult(self.handle, ov, True)
+            results.append(bytes(buf[:n]))
+        return results
+    
     def write_at(self, offset: int, data: bytes):
         """Write bytes to specific offset"""
         self.seek(offset)
@@ -396,169 +636,440 @@ class BlockDevice:
 # DEVICE DISCOVERY
 #=============================================================================
 
-def find_mig_devices() -> List[MIGDeviceInfo]:
+# Discovery is expensive on every platform (subprocess launches on
+# mac/Linux, a storage-stack walk on Windows) and the GUI may refresh
+# several times a second. A short TTL cache absorbs those bursts; the
+# TTL is small enough that a freshly plugged device still shows up
+# within a human-perceptible delay, and connect/remove paths invalidate
+# explicitly.
+_device_cache: Optional[Tuple[float, List[MIGDeviceInfo]]] = None
+_DEVICE_CACHE_TTL = 3.0
+
+
+def invalidate_device_cache():
+    """Drop the cached discovery result (e.g. after unplug/disconnect)"""
+    global _device_cache
+    _device_cache = None
+
+
+def _wrap_progress_cb(cb: Callable) -> Callable[[int, int], None]:
+    """Normalize a dump progress callback to (done, total).
+
+    The dump loops pass the clock reading they already need into the
+    callback as a third now_monotonic argument, so throttling/rate
+    consumers skip their own time.monotonic() per tick. Two-argument
+    legacy callbacks are detected once here (not per call) and adapted.
+    """
+    try:
+        n_params = len(inspect.signature(cb).parameters)
+    except (TypeError, ValueError):
+        n_params = 2
+    if n_params >= 3:
+        def call(done: int, total: int) -> None:
+            cb(done, total, time.monotonic())
+        return call
+    return cb
+
+
+def find_mig_devices(force: bool = False) -> List[MIGDeviceInfo]:
     """
     Find all connected MIG-Flash devices.
     Returns list of device info objects.
+
+    Results are cached for a few seconds; pass force=True to bypass the
+    cache (e.g. for an explicit user-triggered rescan).
     """
+    global _device_cache
+    if not force and _device_cache is not None:
+        ts, cached = _device_cache
+        if time.monotonic() - ts < _DEVICE_CACHE_TTL:
+            return cached
+
     devices = []
-    
+
     if is_windows():
         devices = _find_windows_devices()
     elif is_mac():
         devices = _find_mac_devices()
     elif is_linux():
         devices = _find_linux_devices()
-    
+
+    _device_cache = (time.monotonic(), devices)
     return devices
 
 
-def _find_windows_devices() -> List[MIGDeviceInfo]:
-    """Find MIG devices on Windows"""
-    import win32file
-    import win32con
-    import win32api
-    import winioctlcon
-    import ctypes
-    from ctypes import wintypes
-    
-    kernel32 = ctypes.WinDLL('kernel32')
-    kernel32.FindFirstVolumeW.restype = wintypes.HANDLE
-    kernel32.FindNextVolumeW.argtypes = (wintypes.HANDLE, wintypes.LPWSTR, wintypes.DWORD)
-    kernel32.FindVolumeClose.argtypes = (wintypes.HANDLE,)
-    
-    devices = []
-    
-    # Find all volumes
+def _enumerate_volume_guids() -> List[str]:
+    """List all volume GUID paths via FindFirstVolumeW/FindNextVolumeW.
+
+    Pure enumeration out of the volume manager's tables — cheap and
+    serial. The expensive per-volume storage-stack probing lives in
+    _probe_volume so it can run in parallel.
+    """
+    guids = []
     volume_name = ctypes.create_unicode_buffer(" " * 255)
-    h = kernel32.FindFirstVolumeW(volume_name, 255)
-    
+    h = _KERNEL32.FindFirstVolumeW(volume_name, 255)
+
     if h == win32file.INVALID_HANDLE_VALUE:
-        return devices
-    
+        return guids
+
     while True:
-        guid = volume_name.value
-        
+        guids.append(volume_name.value)
+        if _KERNEL32.FindNextVolumeW(h, volume_name, 255) == 0:
+            break
+
+    _KERNEL32.FindVolumeClose(h)
+    return guids
+
+
+def _probe_volume(guid: str) -> Optional[MIGDeviceInfo]:
+    """Inspect one volume GUID; returns device info for removable drives"""
+    try:
+        if win32file.GetDriveType(guid) != win32con.DRIVE_REMOVABLE:
+            return None
+
+        # Volume GUID paths open with the trailing backslash stripped;
+        # drive-letter roots ("E:\\") need the \\.\ device prefix.
+        if guid.startswith('\\\\'):
+            vol_path = guid[:-1]
+        else:
+            vol_path = rf'\\.\{guid[0]}:'
+
+        # Resolve the physical drive FIRST: CreateFile + the extents
+        # IOCTL talk to the device object without waiting on a mounted
+        # filesystem. GetVolumeInformation, by contrast, can block for
+        # seconds on unformatted or flaky media — so the (cosmetic)
+        # label is looked up last, best-effort, and only for volumes
+        # that actually resolved to a physical drive.
         try:
-            drive_type = win32file.GetDriveType(guid)
-            
-            if drive_type == win32con.DRIVE_REMOVABLE:
+            h_vol = win32file.CreateFile(
+                vol_path,
+                win32con.GENERIC_READ,
+                win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE,
+                None,
+                win32con.OPEN_EXISTING,
+                win32con.FILE_ATTRIBUTE_NORMAL,
+                None
+            )
+
+            r = win32file.DeviceIoControl(
+                h_vol,
+                winioctlcon.IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS,
+                None, 512, None
+            )
+            win32file.CloseHandle(h_vol)
+
+            if len(r) >= 12:
+                # _u32 ('<I') instead of unpack('L'): no per-call format
+                # parse, no r[8:12] slice, and a fixed 4-byte width
+                # ('L' is platform-sized under native alignment).
+                disk_num = _u32.unpack_from(r, 8)[0]
+
                 try:
-                    vol_info = win32api.GetVolumeInformation(guid)
-                    label = vol_info[0]
+                    label = win32api.GetVolumeInformation(guid)[0]
                 except:
                     label = ""
-                
-                # Get physical drive path
-                try:
-                    h_vol = win32file.CreateFile(
-                        guid[:-1],
-                        win32con.GENERIC_READ,
-                        win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE,
-                        None,
-                        win32con.OPEN_EXISTING,
-                        win32con.FILE_ATTRIBUTE_NORMAL,
-                        None
-                    )
-                    
-                    r = win32file.DeviceIoControl(
-                        h_vol,
-                        winioctlcon.IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS,
-                        None, 512, None
-                    )
-                    
-                    if len(r) >= 12:
-                        disk_num = struct.unpack('L', r[8:12])[0]
-                        phys_path = fr"\\.\PhysicalDrive{disk_num}"
-                        
-                        devices.append(MIGDeviceInfo(
-                            path=phys_path,
-                            label=label,
-                            is_removable=True
-                        ))
-                    
-                    win32file.CloseHandle(h_vol)
-                except:
-                    pass
+
+                return MIGDeviceInfo(
+                    path=_PHYS_PATH_FMT(disk_num),
+                    label=label,
+                    is_removable=True
+                )
         except:
             pass
-        
-        # Next volume
-        if kernel32.FindNextVolumeW(h, volume_name, 255) == 0:
-            break
-    
-    kernel32.FindVolumeClose(h)
-    return devices
+    except:
+        pass
+    return None
 
 
-def _find_mac_devices() -> List[MIGDeviceInfo]:
-    """Find MIG devices on macOS"""
-    import subprocess
-    import plistlib
-    
+def _removable_drive_roots() -> List[str]:
+    """Removable drive-letter roots via the GetLogicalDrives bitmap.
+
+    One kernel call yields the letter bitmap; GetDriveTypeW per set bit
+    is answered from cached mount tables — far cheaper than walking
+    every volume GUID on the system just to discard the fixed ones.
+    """
+    bitmap = _KERNEL32.GetLogicalDrives()
+    roots = []
+    for i in range(26):
+        if bitmap >> i & 1:
+            root = f"{chr(65 + i)}:\\"
+            if win32file.GetDriveType(root) == win32con.DRIVE_REMOVABLE:
+                roots.append(root)
+    return roots
+
+
+def _find_windows_devices() -> List[MIGDeviceInfo]:
+    """Find MIG devices on Windows
+
+    Candidates come from the drive-letter bitmap prefilter when any
+    removable letters exist; only if none are found does the full
+    FindFirstVolumeW walk run (covering removable volumes mounted
+    without a letter). Each candidate's GetDriveType/CreateFile/IOCTL
+    sequence then runs on a thread pool: every probe blocks on the
+    storage stack (releasing the GIL), so total discovery latency is
+    roughly max(per-volume) instead of the sum — noticeable when a slow
+    card reader or sleeping disk is attached.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    candidates = _removable_drive_roots()
+    if not candidates:
+        candidates = _enumerate_volume_guids()
+    if not candidates:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as ex:
+        return [dev for dev in ex.map(_probe_volume, candidates)
+                if dev is not None]
+
+
+# Bound .format of the physical-drive template — the probe hot loop
+# then does one call instead of rebuilding an f-string per volume.
+_PHYS_PATH_FMT = r"\\.\PhysicalDrive{}".format
+
+_DISKUTIL_CMD = ("diskutil", "list", "-plist", "external")
+
+
+def _parse_diskutil_plist(plist_data: bytes) -> List[MIGDeviceInfo]:
+    """Turn diskutil's plist output into device infos.
+
+    Pure parse, no subprocess — shared by the sync and async discovery
+    paths.
+    """
     devices = []
-    
+    plist = plistlib.loads(plist_data)
+
+    for disk in plist.get('AllDisksAndPartitions', []):
+        disk_id = disk.get('DeviceIdentifier', '')
+        partitions = disk.get('Partitions', [])
+
+        if partitions:
+            # Single pass, no intermediate list: join consumes the
+            # generator directly and empty names drop out inline.
+            label = ' '.join(s for s in
+                             (p.get('VolumeName') or '' for p in partitions)
+                             if s)
+
+            devices.append(MIGDeviceInfo(
+                path=f'/dev/{disk_id}',
+                label=label,
+                is_removable=True,
+                raw_device=f'/dev/r{disk_id}'  # Raw device for macOS
+            ))
+    return devices
+
+
+def _find_mac_devices_iokit() -> Optional[List[MIGDeviceInfo]]:
+    """Enumerate removable whole-disk IOMedia services via IOKit.
+
+    Queries the kernel registry directly through ctypes instead of
+    forking diskutil (a few hundred ms per call) — the matching
+    dictionary {IOMedia, Removable, Whole} yields exactly the candidate
+    disks, and "BSD Name" gives the /dev node. Volume labels live on
+    the partition media, not the whole disk, so `label` stays empty on
+    this path; it is cosmetic for MIG detection.
+
+    Returns None on any bridge failure so the caller can fall back to
+    the diskutil path.
+    """
     try:
-        result = subprocess.run(
-            ["diskutil", "list", "-plist", "external"],
-            capture_output=True
-        )
-        
-        if result.returncode == 0:
-            plist = plistlib.loads(result.stdout)
-            
-            for disk in plist.get('AllDisksAndPartitions', []):
-                disk_id = disk.get('DeviceIdentifier', '')
-                partitions = disk.get('Partitions', [])
-                
-                if partitions:
-                    labels = [p.get('VolumeName', '') for p in partitions]
-                    label = ' '.join(filter(None, labels))
-                    
+        iokit = ctypes.CDLL(
+            '/System/Library/Frameworks/IOKit.framework/IOKit')
+        cf = ctypes.CDLL(
+            '/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation')
+    except OSError:
+        return None
+
+    try:
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFStringGetCString.restype = ctypes.c_bool
+        cf.CFStringGetCString.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+        cf.CFDictionarySetValue.argtypes = [ctypes.c_void_p] * 3
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        kCFBooleanTrue = ctypes.c_void_p.in_dll(cf, 'kCFBooleanTrue')
+
+        iokit.IOServiceMatching.restype = ctypes.c_void_p
+        iokit.IOServiceMatching.argtypes = [ctypes.c_char_p]
+        iokit.IOServiceGetMatchingServices.restype = ctypes.c_int
+        iokit.IOServiceGetMatchingServices.argtypes = [
+            ctypes.c_uint, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+        iokit.IOIteratorNext.restype = ctypes.c_uint
+        iokit.IOIteratorNext.argtypes = [ctypes.c_uint]
+        iokit.IOObjectRelease.argtypes = [ctypes.c_uint]
+        iokit.IORegistryEntryCreateCFProperty.restype = ctypes.c_void_p
+        iokit.IORegistryEntryCreateCFProperty.argtypes = [
+            ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+
+        kCFStringEncodingUTF8 = 0x08000100
+
+        def cfstr(s: str):
+            return cf.CFStringCreateWithCString(
+                None, s.encode(), kCFStringEncodingUTF8)
+
+        # Matching dict is consumed by IOServiceGetMatchingServices —
+        # no release needed on success.
+        matching = iokit.IOServiceMatching(b'IOMedia')
+        if not matching:
+            return None
+        key_removable = cfstr('Removable')
+        key_whole = cfstr('Whole')
+        cf.CFDictionarySetValue(matching, key_removable, kCFBooleanTrue)
+        cf.CFDictionarySetValue(matching, key_whole, kCFBooleanTrue)
+
+        it = ctypes.c_uint(0)
+        kr = iokit.IOServiceGetMatchingServices(0, matching,
+                                                ctypes.byref(it))
+        cf.CFRelease(key_removable)
+        cf.CFRelease(key_whole)
+        if kr != 0:
+            return None
+
+        devices = []
+        buf = ctypes.create_string_buffer(128)
+        key_bsd = cfstr('BSD Name')
+        while True:
+            svc = iokit.IOIteratorNext(it.value)
+            if not svc:
+                break
+            prop = iokit.IORegistryEntryCreateCFProperty(svc, key_bsd,
+                                                         None, 0)
+            if prop:
+                if cf.CFStringGetCString(prop, buf, len(buf),
+                                         kCFStringEncodingUTF8):
+                    bsd = buf.value.decode()
                     devices.append(MIGDeviceInfo(
-                        path=f'/dev/{disk_id}',
-                        label=label,
+                        path=f'/dev/{bsd}',
+                        label="",
                         is_removable=True,
-                        raw_device=f'/dev/r{disk_id}'  # Raw device for macOS
+                        raw_device=f'/dev/r{bsd}'
                     ))
+                cf.CFRelease(prop)
+            iokit.IOObjectRelease(svc)
+        iokit.IOObjectRelease(it.value)
+        cf.CFRelease(key_bsd)
+        return devices
+    except Exception as e:
+        logger.debug(f"IOKit discovery unavailable ({e}), using diskutil")
+        return None
+
+
+def _find_mac_devices() -> List[MIGDeviceInfo]:
+    """Find MIG devices on macOS (IOKit, diskutil as fallback)"""
+    devices = _find_mac_devices_iokit()
+    if devices is not None:
+        return devices
+
+    try:
+        result = subprocess.run(list(_DISKUTIL_CMD), capture_output=True)
+        if result.returncode == 0:
+            return _parse_diskutil_plist(result.stdout)
     except Exception as e:
         logger.error(f"Error finding Mac devices: {e}")
-    
+
+    return []
+
+
+async def find_mig_devices_async(force: bool = False) -> List[MIGDeviceInfo]:
+    """
+    Async variant of find_mig_devices for event-loop GUIs.
+
+    The macOS path awaits diskutil via create_subprocess_exec instead
+    of blocking in subprocess.run; Windows volume probing (blocking
+    kernel calls) runs on the default executor. Linux sysfs reads are
+    page-cache lookups and run inline. Shares the TTL cache with the
+    sync entry point.
+    """
+    global _device_cache
+    if not force and _device_cache is not None:
+        ts, cached = _device_cache
+        if time.monotonic() - ts < _DEVICE_CACHE_TTL:
+            return cached
+
+    import asyncio
+
+    if is_mac():
+        proc = await asyncio.create_subprocess_exec(
+            *_DISKUTIL_CMD,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await proc.communicate()
+        devices = _parse_diskutil_plist(stdout) if proc.returncode == 0 else []
+    elif is_windows():
+        loop = asyncio.get_running_loop()
+        devices = await loop.run_in_executor(None, _find_windows_devices)
+    elif is_linux():
+        devices = _find_linux_devices()
+    else:
+        devices = []
+
+    _device_cache = (time.monotonic(), devices)
     return devices
 
 
+def _linux_disk_labels(disk: str) -> List[str]:
+    """Filesystem labels of all partitions on /dev/<disk>.
+
+    /dev/disk/by-label holds one symlink per labeled filesystem; the
+    link target names the partition device, so matching its basename
+    against the disk's partition naming replaces lsblk's child walk.
+    """
+    labels = []
+    # Exact partition-name match, not a bare prefix: 'sda' must claim
+    # sda1/sda2 but not sdab or its partitions. Disks whose name ends
+    # in a digit (nvme0n1, mmcblk0) insert a 'p' before the partition
+    # number, hence the optional 'p'.
+    part_re = re.compile(rf'{re.escape(disk)}(?:p?\d+)?')
+    try:
+        for entry in os.scandir('/dev/disk/by-label'):
+            try:
+                target = os.path.basename(os.readlink(entry.path))
+            except OSError:
+                continue
+            if part_re.fullmatch(target):
+                labels.append(entry.name)
+    except OSError:
+        pass  # No labeled filesystems present
+    return labels
+
+
 def _find_linux_devices() -> List[MIGDeviceInfo]:
-    """Find MIG devices on Linux"""
-    import subprocess
-    
+    """Find MIG devices on Linux
+
+    Reads sysfs directly instead of forking lsblk and parsing its JSON:
+    /sys/block/<disk>/removable gives the removable flag and the
+    resolved device symlink reveals the USB transport (the path runs
+    through the usb bus directory). A discovery pass is then a handful
+    of page-cache reads with no subprocess launch.
+    """
     devices = []
-    
+
     try:
-        result = subprocess.run(
-            ["lsblk", "-o", "path,type,fstype,tran,label", "-J"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            
-            for block in data.get('blockdevices', []):
-                if block.get('type') == 'disk' and block.get('tran') == 'usb':
-                    path = block.get('path', '')
-                    children = block.get('children', [])
-                    
-                    labels = [c.get('label', '') for c in children]
-                    label = ' '.join(filter(None, labels))
-                    
-                    devices.append(MIGDeviceInfo(
-                        path=path,
-                        label=label,
-                        is_removable=True
-                    ))
+        for entry in os.scandir('/sys/block'):
+            name = entry.name
+            try:
+                with open(os.path.join(entry.path, 'removable')) as fh:
+                    if fh.read(2).strip() != '1':
+                        continue
+                dev_path = os.path.realpath(os.path.join(entry.path, 'device'))
+            except OSError:
+                continue  # Device vanished mid-scan
+
+            # Equivalent of lsblk's tran=='usb'
+            if '/usb' not in dev_path:
+                continue
+
+            devices.append(MIGDeviceInfo(
+                path=f'/dev/{name}',
+                label=' '.join(_linux_disk_labels(name)),
+                is_removable=True
+            ))
     except Exception as e:
         logger.error(f"Error finding Linux devices: {e}")
-    
+
     return devices
 
 
@@ -595,6 +1106,20 @@ class MIGFlash:
         self._firmware_version: Optional[str] = None
         self._cart_info: Optional[CartridgeInfo] = None
         self._xci_header: Optional[XCIHeader] = None
+
+        # UID and certificate are immutable for a given cart/connection;
+        # GUIs that display them poll repeatedly, so cache after the
+        # first successful read. Dropped on disconnect with the rest of
+        # the per-connection state.
+        self._uid_cache: Optional[bytes] = None
+        self._cert_cache: Optional[bytes] = None
+
+        # cart_inserted probe cache: each probe is a real USB read with
+        # multi-ms latency and GUIs poll the property at 10+ Hz. A
+        # 250 ms TTL absorbs the poll traffic while still noticing an
+        # inserted/removed cart within a frame or two.
+        self._cart_probe_ts: float = 0.0
+        self._cart_probe_result: bool = False
     
     #-------------------------------------------------------------------------
     # CONNECTION
@@ -671,7 +1196,13 @@ class MIGFlash:
         self._firmware_version = None
         self._cart_info = None
         self._xci_header = None
-        
+        self._uid_cache = None
+        self._cert_cache = None
+        self._invalidate_cart_probe()
+
+        # The device set likely changed (user is unplugging/replugging).
+        invalidate_device_cache()
+
         logger.info("Disconnected from MIG-Flash")
     
     @property
@@ -680,10 +1211,19 @@ class MIGFlash:
         return self._connected
     
     def _verify_device(self) -> bool:
-        """Verify device is a MIG-Flash by checking GPT"""
+        """Verify device is a MIG-Flash by checking GPT
+
+        Deliberately reads a full sector even though only the 16-byte
+        type GUID is inspected: raw volume handles (Windows) and
+        O_DIRECT fds reject sub-sector reads, and USB mass storage
+        transfers whole sectors either way. The GUID compare itself is
+        allocation-free — is_msdata_guid checks two packed u64 words
+        in place instead of slicing bytes out of the sector.
+        """
         try:
-            data = self.device.read_at(MemoryMap.GPT_PARTITION_OFFSET, 512)
-            return data[0:16] == GPT_MSDATA_GUID
+            data = self.device.read_at(MemoryMap.GPT_PARTITION_OFFSET,
+                                       SECTOR_SIZE)
+            return is_msdata_guid(data)
         except:
             return False
     
@@ -718,17 +1258,28 @@ class MIGFlash:
     
     @property
     def cart_inserted(self) -> bool:
-        """Check if cartridge is inserted"""
+        """Check if cartridge is inserted (cached for 250 ms)"""
         if not self._connected:
             return False
-        
+
+        now = time.monotonic()
+        if now - self._cart_probe_ts < 0.25:
+            return self._cart_probe_result
+
         try:
             # Try to read XCI header area
             data = self.device.read_at(MemoryMap.XCI_HEADER_OFFSET, 4)
             # Check for "HEAD" magic
-            return data == b'HEAD'
+            result = data == b'HEAD'
         except:
-            return False
+            result = False
+        self._cart_probe_ts = now
+        self._cart_probe_result = result
+        return result
+
+    def _invalidate_cart_probe(self):
+        """Force the next cart_inserted access to hit the hardware"""
+        self._cart_probe_ts = 0.0
     
     @property
     def cart_authenticated(self) -> bool:
@@ -752,7 +1303,9 @@ class MIGFlash:
         """
         if not self._connected:
             raise ConnectionError("Not connected")
-        
+
+        # Authentication is a state transition — probe fresh.
+        self._invalidate_cart_probe()
         if not self.cart_inserted:
             raise RuntimeError("No cartridge inserted")
         
@@ -822,17 +1375,38 @@ class MIGFlash:
             MemoryMap.XCI_DATA_OFFSET + offset,
             length
         )
-    
-    def dump_xci(self, filename: str,
+
+    def read_xci_into(self, offset: int, buf) -> int:
+        """
+        Read XCI data into a caller-supplied buffer (memoryview slice).
+
+        Zero-allocation variant of read_xci for dump loops that recycle
+        preallocated buffers. Returns the number of bytes read.
+        """
+        if not self.cart_authenticated:
+            raise RuntimeError("Authentication required")
+
+        return self.device.read_into(
+            MemoryMap.XCI_DATA_OFFSET + offset,
+            buf
+        )
+
+    def dump_xci(self, filename,
                  trimmed: bool = True,
                  progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
         """
         Dump entire XCI to file.
         
         Args:
-            filename: Output filename.
+            filename: Output filename, or an already-open binary file
+                object (callers that want cache-control hints on the
+                output — see MIGController._prepare_dump_file — open
+                the fd themselves and pass the file object; it is
+                written and left open for the caller to finalize).
             trimmed: If True, only dump used data (smaller file).
-            progress_callback: Called with (bytes_done, total_bytes).
+            progress_callback: Called with (bytes_done, total_bytes);
+                callbacks taking a third parameter also receive the
+                current time.monotonic() reading.
         
         Returns:
             True if successful.
@@ -844,27 +1418,212 @@ class MIGFlash:
         total_size, trimmed_size = self.get_xci_size()
         dump_size = trimmed_size if trimmed else total_size
         
-        logger.info(f"Dumping XCI: {dump_size / (1024*1024*1024):.2f} GB")
+        if progress_callback is not None:
+            progress_callback = _wrap_progress_cb(progress_callback)
         
-        chunk_size = 1024 * 1024  # 1 MB chunks
-        offset = 0
+        is_fileobj = hasattr(filename, 'write')
+        out_name = getattr(filename, 'name', '<stream>') if is_fileobj \
+            else filename
         
-        with open(filename, 'wb') as f:
-            while offset < dump_size:
-                # Read chunk
-                remaining = dump_size - offset
-                read_size = min(chunk_size, remaining)
-                
-                data = self.read_xci(offset, read_size)
-                f.write(data)
-                
-                offset += len(data)
-                
-                # Progress callback
+        logger.info(f"Dumping XCI: {dump_size / (1024*1024*1024):.2f} GB")
+
+        # Fast path (Linux, buffered mode): let the kernel move the
+        # bytes itself via sendfile — zero userspace copies, zero Python
+        # chunk objects. If the first sendfile refuses this fd pair the
+        # partially written file is reopened (truncated) by the
+        # pipelined fallback below.
+        if not is_windows() and not self.device._direct:
+            f = filename if is_fileobj else open(filename, 'wb')
+            # Tracks how far sendfile got: fallback is legitimate only
+            # for the unsupported-fd-pair errors, and those all fail
+            # on the FIRST call, before any bytes move. A mid-stream
+            # OSError (e.g. EIO from dying media) must surface, not
+            # silently restart a multi-GB dump from zero.
+            sf_copied = 0
+            
+            def _sf_progress(done: int):
+                nonlocal sf_copied
+                sf_copied = done
+                if progress_callback:
+                    progress_callback(done, dump_size)
+            
+            try:
+                self.device.advise_sequential()
+                self.device.copy_range(
+                    MemoryMap.XCI_DATA_OFFSET, dump_size, f.fileno(),
+                    progress=_sf_progress)
+                logger.info(f"Dump complete: {out_name}")
+                return True
+            except InterruptedError:
+                # User abort from the progress callback — it is an
+                # OSError subclass, but never a reason to fall back.
+                raise
+            except OSError as e:
+                if sf_copied:
+                    raise
+                # Rewind a caller-supplied file; a path is reopened
+                # (truncated) by the fallback paths below.
+                if is_fileobj:
+                    f.seek(0)
+                    f.truncate()
+                logger.debug(f"sendfile path unavailable ({e}), "
+                             f"using pipelined dump")
+            finally:
+                if not is_fileobj and (f.closed is False):
+                    f.close()
+
+        # Second choice where sendfile is out (Windows, O_DIRECT device
+        # mode): preallocate the output to its final size and map it,
+        # then read device chunks straight into the mapping. The data
+        # lands once in the file's page-cache pages — no bounce
+        # buffers, no write() syscalls — and the kernel writes the
+        # pages back asynchronously behind the reads. Falls through to
+        # the threaded bounce-buffer pipeline if the platform or fd
+        # refuses the mapping (e.g. a write-only caller fd).
+        chunk_size = 4 * 1024 * 1024
+        f = filename if is_fileobj else open(filename, 'w+b')
+        mapped = None
+        try:
+            os.ftruncate(f.fileno(), dump_size)
+            if dump_size:
+                mapped = mmap.mmap(f.fileno(), dump_size)
+        except (OSError, ValueError) as e:
+            logger.debug(f"mmap output path unavailable ({e}), "
+                         f"using pipelined dump")
+            if is_fileobj:
+                f.seek(0)
+                f.truncate()
+        finally:
+            if not is_fileobj and mapped is None:
+                f.close()
+        if mapped is not None:
+            view = memoryview(mapped)
+            try:
+                base = MemoryMap.XCI_DATA_OFFSET
+                dev_read_into = self.device.read_into
+                offset = 0
+                while offset < dump_size:
+                    end = min(offset + chunk_size, dump_size)
+                    n = dev_read_into(base + offset, view[offset:end])
+                    if n == 0:
+                        raise IOError(f"short read at XCI offset {offset}")
+                    offset += n
+                    if progress_callback:
+                        progress_callback(offset, dump_size)
+                mapped.flush()
+            finally:
+                view.release()
+                mapped.close()
+                if not is_fileobj:
+                    f.close()
+            logger.info(f"Dump complete: {out_name}")
+            return True
+
+        # USB read and file write hit independent devices; running them
+        # strictly in turn leaves each idle half the time. A reader
+        # thread keeps a bounded queue of chunks ahead of the writer,
+        # so the two I/Os overlap; 4 MiB chunks amortize the
+        # per-request cost of the mass-storage link. Depth 8 (~32 MiB
+        # in flight) rides out multi-chunk writeback stalls on the
+        # output drive without pausing the USB reader.
+        chunk_queue: queue.Queue = queue.Queue(maxsize=8)
+
+        # Fixed set of recycled buffers instead of one fresh bytes
+        # object per chunk: a 32 GiB dump would otherwise allocate (and
+        # page in) 32 GiB of short-lived chunk objects. The free list
+        # holds queue depth + 1 buffers so the reader always has one to
+        # fill while the others sit in the queue or at the writer.
+        free_bufs: queue.Queue = queue.Queue()
+        for _ in range(chunk_queue.maxsize + 1):
+            free_bufs.put(bytearray(chunk_size))
+
+        # Set by the writer when it bails early (abort, write error);
+        # GIL-atomic read in the reader loop. Without it the reader
+        # would block forever in put() on the full queue once the
+        # writer is gone, leaking the thread and the buffer set.
+        writer_gone = False
+
+        def _reader():
+            try:
+                # Hot loop: the XCI base offset and the device method
+                # are bound once (auth was checked above), so each
+                # chunk costs one read_into call instead of the
+                # read_xci_into attribute walk and its re-check.
+                base = MemoryMap.XCI_DATA_OFFSET
+                dev_read_into = self.device.read_into
+                get_buf = free_bufs.get
+                put_chunk = chunk_queue.put
+                if dump_size % chunk_size == 0:
+                    # Aligned fast path — real cart sizes (1..32 GiB)
+                    # are all multiples of the chunk size, so the
+                    # common case needs no per-iteration min() or
+                    # remaining-bytes bookkeeping.
+                    for read_off in range(0, dump_size, chunk_size):
+                        if writer_gone:
+                            return
+                        buf = get_buf()
+                        n = dev_read_into(base + read_off,
+                                          memoryview(buf))
+                        if n != chunk_size:
+                            raise IOError(
+                                f"short read at XCI offset {read_off}")
+                        put_chunk((buf, n))
+                else:
+                    read_off = 0
+                    while read_off < dump_size:
+                        if writer_gone:
+                            return
+                        read_size = min(chunk_size, dump_size - read_off)
+                        buf = get_buf()
+                        n = dev_read_into(base + read_off,
+                                          memoryview(buf)[:read_size])
+                        if n == 0:
+                            raise IOError(
+                                f"short read at XCI offset {read_off}")
+                        put_chunk((buf, n))
+                        read_off += n
+            except Exception as e:
+                chunk_queue.put(e)
+            else:
+                chunk_queue.put(None)  # end-of-dump marker
+
+        reader = threading.Thread(target=_reader, name="mig-dump-reader",
+                                  daemon=True)
+        reader.start()
+
+        offset = 0
+        f = filename if is_fileobj else open(filename, 'wb')
+        try:
+            while True:
+                item = chunk_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                buf, n = item
+                f.write(memoryview(buf)[:n])
+                free_bufs.put(buf)
+                offset += n
                 if progress_callback:
                     progress_callback(offset, dump_size)
-        
-        logger.info(f"Dump complete: {filename}")
+        finally:
+            if not is_fileobj:
+                f.close()
+            # Always reap the reader, including on abort or a write
+            # error: flag it to stop, then drain the queue (returning
+            # chunk buffers to the free list) so a put() or get_buf()
+            # it is blocked on completes and the stop flag is seen.
+            writer_gone = True
+            while reader.is_alive():
+                try:
+                    item = chunk_queue.get_nowait()
+                    if isinstance(item, tuple):
+                        free_bufs.put(item[0])
+                except queue.Empty:
+                    pass
+                reader.join(timeout=0.05)
+
+        logger.info(f"Dump complete: {out_name}")
         return True
     
     #-------------------------------------------------------------------------
@@ -872,25 +1631,29 @@ class MIGFlash:
     #-------------------------------------------------------------------------
     
     def read_uid(self) -> bytes:
-        """Read cartridge UID"""
+        """Read cartridge UID (cached per connection)"""
         if not self._connected:
             raise ConnectionError("Not connected")
-        
-        # UID is typically in the XCI header area
-        return self.device.read_at(
-            MemoryMap.XCI_HEADER_OFFSET + 0x100,
-            16
-        )
-    
+
+        if self._uid_cache is None:
+            # UID is typically in the XCI header area
+            self._uid_cache = self.device.read_at(
+                MemoryMap.XCI_HEADER_OFFSET + 0x100,
+                16
+            )
+        return self._uid_cache
+
     def read_certificate(self) -> bytes:
-        """Read cartridge certificate"""
+        """Read cartridge certificate (cached per connection)"""
         if not self.cart_authenticated:
             raise RuntimeError("Authentication required")
-        
-        return self.device.read_at(
-            MemoryMap.XCI_CERT_OFFSET,
-            MemoryMap.XCI_CERT_SIZE
-        )
+
+        if self._cert_cache is None:
+            self._cert_cache = self.device.read_at(
+                MemoryMap.XCI_CERT_OFFSET,
+                MemoryMap.XCI_CERT_SIZE
+            )
+        return self._cert_cache
     
     #-------------------------------------------------------------------------
     # CONTEXT MANAGER
@@ -982,8 +1745,11 @@ def main():
                     return
                 
                 def on_progress(done, total):
-                    pct = done / total * 100
-                    print(f"\rProgress: {pct:.1f}% ({done}/{total})", end='')
+                    # Integer-only percent math + printf formatting:
+                    # cheapest path for a per-chunk callback.
+                    pct_tenths = (done * 1000) // total if total else 0
+                    print("\rProgress: %d.%d%% (%d/%d)"
+                          % (*divmod(pct_tenths, 10), done, total), end='')
                 
                 print(f"Dumping to {args.output}...")
                 mig.dump_xci(
@@ -1003,7 +1769,6 @@ def main():
 if __name__ == "__main__":
     # Check for admin privileges
     if is_windows():
-        import ctypes
         if not ctypes.windll.shell32.IsUserAnAdmin():
             print("Please run as Administrator!")
             sys.exit(1)
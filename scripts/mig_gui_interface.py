@@ -16,9 +16,14 @@ Version: 2.0.0
 Date: 2026-01-20
 """
 
+import io
+import os
 import threading
 import queue
 import time
+from collections import deque, namedtuple
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, Callable, List, Any
 from enum import Enum, auto
@@ -65,25 +70,56 @@ class MIGState(Enum):
 # EVENT DATA
 #=============================================================================
 
-@dataclass
 class MIGEventData:
-    """Event data passed to callbacks"""
-    event: MIGEvent
-    state: MIGState
-    message: str = ""
-    progress: float = 0.0          # 0-100%
-    bytes_done: int = 0
-    bytes_total: int = 0
-    speed_kbps: int = 0
-    eta_seconds: int = 0
-    error: Optional[Exception] = None
-    data: Any = None               # Event-specific data
+    """Event data passed to callbacks.
+    
+    Mutable __slots__ holder recycled through the controller's event
+    pool: a multi-GB dump would otherwise allocate tens of thousands of
+    short-lived event objects for progress ticks alone. Callbacks must
+    treat instances as borrowed — snapshot any fields needed after the
+    callback returns (see the Tkinter example's on_event).
+    """
+    __slots__ = ('event', 'state', 'message', 'progress', 'bytes_done',
+                 'bytes_total', 'speed_kbps', 'eta_seconds', 'error', 'data')
+    
+    def __init__(self,
+                 event: Optional[MIGEvent] = None,
+                 state: Optional[MIGState] = None,
+                 message: str = "",
+                 progress: float = 0.0,          # 0-100%; DUMP_PROGRESS
+                                                 # sends int tenths (0-1000)
+                 bytes_done: int = 0,
+                 bytes_total: int = 0,
+                 speed_kbps: int = 0,
+                 eta_seconds: int = 0,
+                 error: Optional[Exception] = None,
+                 data: Any = None):              # Event-specific data
+        self.event = event
+        self.state = state
+        self.message = message
+        self.progress = progress
+        self.bytes_done = bytes_done
+        self.bytes_total = bytes_total
+        self.speed_kbps = speed_kbps
+        self.eta_seconds = eta_seconds
+        self.error = error
+        self.data = data
 
 
 #=============================================================================
 # GUI CONTROLLER
 #=============================================================================
 
+# Everything the monitor thread reads about the current connection,
+# packed into one immutable tuple. Mutators build a new snapshot and
+# rebind self._cache in a single GIL-atomic store, so the monitor sees
+# either the old or the new state in full — never a half-updated mix of
+# four separate attributes.
+CacheSnapshot = namedtuple('CacheSnapshot',
+                           'mig device_info cart_info xci_header')
+_EMPTY_CACHE = CacheSnapshot(None, None, None, None)
+
+
 class MIGController:
     """
     MIG-Flash GUI Controller
@@ -106,23 +142,42 @@ class MIGController:
     """
     
     def __init__(self):
-        self._mig: Optional[MIGFlash] = None
+        self._cache = _EMPTY_CACHE
         self._state = MIGState.DISCONNECTED
         self._event_callback: Optional[Callable[[MIGEventData], None]] = None
         
-        # Threading
-        self._worker_thread: Optional[threading.Thread] = None
-        self._abort_flag = threading.Event()
-        self._lock = threading.Lock()
+        # Threading — one persistent worker serializes all USB
+        # operations: GUI actions submit closures instead of paying
+        # thread creation/teardown per click, and two operations can
+        # never race on the device because they share the queue.
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix="mig-worker")
+        self._future: Optional[Future] = None
+        # Plain bool, not a threading.Event: a single word written by
+        # abort_dump and read by the dump worker is atomic under the
+        # GIL, and the per-tick read costs one attribute load instead
+        # of an Event.is_set() call in the tightest in-process path.
+        self._abort = False
+        # Locking invariant: all mutating controller operations run on
+        # _executor (a single worker), so they never race each other
+        # and need no lock. The monitor reads self._cache lock-free
+        # (an immutable snapshot, rebound atomically); _cache_lock
+        # serializes only the read-modify-write snapshot rebuilds,
+        # because the monitor itself rebuilds on cart removal.
+        self._cache_lock = threading.Lock()
+        # Set while a DUMP_PROGRESS event is in flight to the GUI and
+        # not yet applied; lets the progress gate coalesce instead of
+        # queueing events faster than the GUI drains them.
+        self._progress_pending = threading.Event()
         
         # Device monitoring
         self._monitor_thread: Optional[threading.Thread] = None
         self._monitoring = False
+        self._monitor_stop = threading.Event()
+        
+        # Bounded free-list of recycled event objects (see MIGEventData)
+        self._event_pool: deque = deque(maxlen=8)
         
-        # Cached info
-        self._device_info: Optional[MIGDeviceInfo] = None
-        self._cart_info: Optional[CartridgeInfo] = None
-        self._xci_header: Optional[XCIHeader] = None
     
     #-------------------------------------------------------------------------
     # PROPERTIES
@@ -133,6 +188,26 @@ class MIGController:
         """Current device state"""
         return self._state
     
+    @property
+    def _mig(self) -> Optional[MIGFlash]:
+        return self._cache.mig
+    
+    def _maybe_lock(self):
+        """Guard for cache rebuilds.
+        
+        The monitor thread is the only rebuilder that can run
+        concurrently with the executor worker; while it is not
+        running (headless/CLI use) there is nothing to serialize
+        against, so rebuilds take a free nullcontext instead of a
+        real lock acquisition.
+        """
+        return self._cache_lock if self._monitoring else nullcontext()
+    
+    def _update_cache(self, **fields):
+        """Rebuild and atomically rebind the cache snapshot"""
+        with self._maybe_lock():
+            self._cache = self._cache._replace(**fields)
+    
     @property
     def is_connected(self) -> bool:
         """Check if connected to device"""
@@ -141,7 +216,7 @@ class MIGController:
     @property
     def device_info(self) -> Optional[MIGDeviceInfo]:
         """Connected device info"""
-        return self._device_info
+        return self._cache.device_info
     
     @property
     def firmware_version(self) -> str:
@@ -153,12 +228,12 @@ class MIGController:
     @property
     def cart_info(self) -> Optional[CartridgeInfo]:
         """Cartridge information"""
-        return self._cart_info
+        return self._cache.cart_info
     
     @property
     def xci_header(self) -> Optional[XCIHeader]:
         """XCI header data"""
-        return self._xci_header
+        return self._cache.xci_header
     
     #-------------------------------------------------------------------------
     # CALLBACKS
@@ -173,21 +248,97 @@ class MIGController:
         """
         self._event_callback = callback
     
-    def _emit_event(self, event: MIGEvent, message: str = "", **kwargs):
-        """Send event to callback"""
+    def _acquire_event(self) -> MIGEventData:
+        """Take an event object from the pool (or make one)"""
+        # pop() inside the except, not behind a truthiness check: the
+        # executor worker and the monitor thread emit concurrently,
+        # and check-then-pop lets both pass the check for one object.
+        # deque.pop() itself is atomic; losing the race just builds a
+        # fresh event.
+        try:
+            return self._event_pool.pop()
+        except IndexError:
+            return MIGEventData()
+    
+    def _release_event(self, ev: MIGEventData):
+        """Return a consumed event object to the pool"""
+        # Drop object references so the pool can't keep exceptions or
+        # payloads (device lists, cart info) alive.
+        ev.error = None
+        ev.data = None
+        self._event_pool.append(ev)
+    
+    def _emit_event(self, event: MIGEvent, message: str = "",
+                    progress: float = 0.0, bytes_done: int = 0,
+                    bytes_total: int = 0, speed_kbps: int = 0,
+                    eta_seconds: int = 0, error: Optional[Exception] = None,
+                    data: Any = None):
+        """Send event to callback (the object is recycled afterwards)"""
         if self._event_callback:
-            data = MIGEventData(
-                event=event,
-                state=self._state,
-                message=message,
-                **kwargs
-            )
-            self._event_callback(data)
+            ev = self._acquire_event()
+            ev.event = event
+            ev.state = self._state
+            ev.message = message
+            ev.progress = progress
+            ev.bytes_done = bytes_done
+            ev.bytes_total = bytes_total
+            ev.speed_kbps = speed_kbps
+            ev.eta_seconds = eta_seconds
+            ev.error = error
+            ev.data = data
+            self._event_callback(ev)
+            self._release_event(ev)
+    
+    def _emit_progress(self, pct_tenths: int, done: int, total: int,
+                       speed_kbps: int, eta_seconds: int):
+        """Fast-path emitter for DUMP_PROGRESS.
+        
+        The dump loop is the only caller that emits at rate; this
+        skips the generic _emit_event defaults (error/data handling,
+        message pass-through) and fills the pooled object directly.
+        """
+        cb = self._event_callback
+        if cb is None:
+            return
+        ev = self._acquire_event()
+        ev.event = MIGEvent.DUMP_PROGRESS
+        ev.state = self._state
+        ev.message = "%d.%d%%" % divmod(pct_tenths, 10)
+        ev.progress = pct_tenths
+        ev.bytes_done = done
+        ev.bytes_total = total
+        ev.speed_kbps = speed_kbps
+        ev.eta_seconds = eta_seconds
+        ev.error = None
+        ev.data = None
+        cb(ev)
+        self._release_event(ev)
     
     def _set_state(self, state: MIGState):
         """Update state"""
         self._state = state
     
+    # Events that are safe to drop when the state already matches the
+    # target: re-announcing them (monitor racing a direct call, repeated
+    # loss detection) only duplicates downstream work.
+    _IDEMPOTENT_EVENTS = frozenset({
+        MIGEvent.DEVICE_DISCONNECTED,
+        MIGEvent.CART_INSERTED,
+        MIGEvent.CART_REMOVED,
+    })
+    
+    def _transition(self, new_state: MIGState, event: MIGEvent,
+                    message: str = "", **kw):
+        """Fused state change + event emit.
+        
+        Short-circuits when the state is unchanged and the event is
+        idempotent, so redundant transitions emit nothing.
+        """
+        if new_state == self._state and event in self._IDEMPOTENT_EVENTS:
+            return
+        self._state = new_state
+        self._emit_event(event, message, **kw)
+    
     #-------------------------------------------------------------------------
     # DEVICE DISCOVERY
     #-------------------------------------------------------------------------
@@ -209,7 +360,7 @@ class MIGController:
             except Exception as e:
                 self._emit_event(MIGEvent.ERROR, str(e), error=e)
         
-        threading.Thread(target=worker, daemon=True).start()
+        self._future = self._executor.submit(worker)
     
     #-------------------------------------------------------------------------
     # CONNECTION
@@ -217,41 +368,47 @@ class MIGController:
     
     def connect(self, device_path: Optional[str] = None) -> bool:
         """Connect to device (synchronous)"""
-        with self._lock:
-            if self._mig:
-                self._mig.disconnect()
+        # One MIGFlash instance lives for the controller's lifetime:
+        # reconnects (the cart-swap workflow) reopen the device on it
+        # instead of rebuilding the backend object each time. Only
+        # close() drops it.
+        with self._maybe_lock():
+            mig = self._cache.mig
+            if mig is None:
+                mig = MIGFlash()
+                self._cache = self._cache._replace(mig=mig)
+        if mig.is_connected:
+            mig.disconnect()
+        
+        try:
+            mig.connect(device_path)
+            self._update_cache(device_info=mig.device_info)
+            self._set_state(MIGState.CONNECTED)
             
-            self._mig = MIGFlash()
+            # Check cart status
+            if mig.cart_inserted:
+                self._set_state(MIGState.CART_DETECTED)
+            else:
+                self._set_state(MIGState.NO_CART)
             
-            try:
-                self._mig.connect(device_path)
-                self._device_info = self._mig.device_info
-                self._set_state(MIGState.CONNECTED)
-                
-                # Check cart status
-                if self._mig.cart_inserted:
-                    self._set_state(MIGState.CART_DETECTED)
-                else:
-                    self._set_state(MIGState.NO_CART)
-                
-                return True
-                
-            except Exception as e:
-                self._set_state(MIGState.ERROR)
-                raise
+            return True
+            
+        except Exception as e:
+            self._set_state(MIGState.ERROR)
+            raise
     
     def connect_async(self, device_path: Optional[str] = None):
         """Connect to device asynchronously"""
         def worker():
-            self._set_state(MIGState.CONNECTING)
-            self._emit_event(MIGEvent.DEVICE_CONNECTED, "Connecting...")
+            self._transition(MIGState.CONNECTING,
+                             MIGEvent.DEVICE_CONNECTED, "Connecting...")
             
             try:
                 self.connect(device_path)
                 self._emit_event(
                     MIGEvent.DEVICE_CONNECTED,
                     f"Connected: {self.firmware_version}",
-                    data=self._device_info
+                    data=self.device_info
                 )
                 
                 # Notify cart status
@@ -261,25 +418,21 @@ class MIGController:
                     self._emit_event(MIGEvent.CART_REMOVED, "No cartridge")
                     
             except Exception as e:
-                self._set_state(MIGState.ERROR)
-                self._emit_event(MIGEvent.ERROR, str(e), error=e)
+                self._transition(MIGState.ERROR, MIGEvent.ERROR,
+                                 str(e), error=e)
         
-        self._worker_thread = threading.Thread(target=worker, daemon=True)
-        self._worker_thread.start()
+        self._future = self._executor.submit(worker)
     
     def disconnect(self):
-        """Disconnect from device"""
-        with self._lock:
-            if self._mig:
-                self._mig.disconnect()
-                self._mig = None
-            
-            self._device_info = None
-            self._cart_info = None
-            self._xci_header = None
-            self._set_state(MIGState.DISCONNECTED)
+        """Disconnect from device (the MIGFlash instance is retained)"""
+        mig = self._cache.mig
+        if mig and mig.is_connected:
+            mig.disconnect()
         
-        self._emit_event(MIGEvent.DEVICE_DISCONNECTED, "Disconnected")
+        self._update_cache(device_info=None, cart_info=None,
+                           xci_header=None)
+        self._transition(MIGState.DISCONNECTED,
+                         MIGEvent.DEVICE_DISCONNECTED, "Disconnected")
     
     #-------------------------------------------------------------------------
     # AUTHENTICATION
@@ -287,43 +440,45 @@ class MIGController:
     
     def authenticate(self) -> bool:
         """Authenticate cartridge (synchronous)"""
-        if not self._mig:
+        if not self.is_connected:
             raise RuntimeError("Not connected")
         
-        with self._lock:
-            success = self._mig.authenticate()
-            
-            if success:
-                self._xci_header = self._mig._xci_header
-                self._cart_info = self._mig._cart_info
-                self._set_state(MIGState.AUTHENTICATED)
-            else:
-                self._set_state(MIGState.ERROR)
-            
-            return success
+        # No lock around the operation itself: runs on the single-
+        # worker executor (or a caller's thread that already owns the
+        # operation); see the _cache_lock note in __init__.
+        mig = self._cache.mig
+        success = mig.authenticate()
+        
+        if success:
+            self._update_cache(cart_info=mig._cart_info,
+                               xci_header=mig._xci_header)
+            self._set_state(MIGState.AUTHENTICATED)
+        else:
+            self._set_state(MIGState.ERROR)
+        
+        return success
     
     def authenticate_async(self):
         """Authenticate cartridge asynchronously"""
         def worker():
-            self._set_state(MIGState.AUTHENTICATING)
-            self._emit_event(MIGEvent.AUTH_STARTED, "Authenticating...")
+            self._transition(MIGState.AUTHENTICATING,
+                             MIGEvent.AUTH_STARTED, "Authenticating...")
             
             try:
                 if self.authenticate():
                     self._emit_event(
                         MIGEvent.AUTH_SUCCESS,
                         "Authentication successful",
-                        data=self._cart_info
+                        data=self.cart_info
                     )
                 else:
                     self._emit_event(MIGEvent.AUTH_FAILED, "Authentication failed")
                     
             except Exception as e:
-                self._set_state(MIGState.ERROR)
-                self._emit_event(MIGEvent.AUTH_FAILED, str(e), error=e)
+                self._transition(MIGState.ERROR, MIGEvent.AUTH_FAILED,
+                                 str(e), error=e)
         
-        self._worker_thread = threading.Thread(target=worker, daemon=True)
-        self._worker_thread.start()
+        self._future = self._executor.submit(worker)
     
     #-------------------------------------------------------------------------
     # XCI DUMPING
@@ -332,15 +487,51 @@ class MIGController:
     def dump_xci(self, filename: str, trimmed: bool = True,
                  progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
         """Dump XCI to file (synchronous)"""
-        if not self._mig:
+        if not self.is_connected:
             raise RuntimeError("Not connected")
         
-        return self._mig.dump_xci(filename, trimmed, progress_callback)
+        f = self._prepare_dump_file(filename)
+        if f is None:
+            # No fadvise on this platform: hand the path straight down.
+            return self._mig.dump_xci(filename, trimmed, progress_callback)
+        try:
+            success = self._mig.dump_xci(f, trimmed, progress_callback)
+            self._finalize_dump_file(f)
+            return success
+        finally:
+            f.close()
+    
+    def _prepare_dump_file(self, filename: str) -> Optional[io.FileIO]:
+        """Open the dump output with page-cache hints.
+        
+        A multi-GB XCI stream is written once and never re-read, yet a
+        plain open() lets it churn tens of GB through the page cache,
+        evicting memory the concurrent USB read path could use. Where
+        posix_fadvise exists the fd is hinted SEQUENTIAL up front and
+        the pages are dropped again in _finalize_dump_file. Returns
+        None where the hint API is unavailable (Windows) — the caller
+        then falls back to the plain path-based dump.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return None
+        # O_RDWR (not O_WRONLY): the dumper's mmap output strategy
+        # needs a readable fd to establish a shared writable mapping.
+        fd = os.open(filename, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        f = io.FileIO(fd, 'wb')
+        f.name = filename   # fd-opened FileIO would otherwise report the fd
+        return f
+    
+    def _finalize_dump_file(self, f: io.FileIO):
+        """Flush, persist and evict the finished dump from the cache"""
+        f.flush()
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
     
     def dump_xci_async(self, filename: str, trimmed: bool = True):
         """Dump XCI to file asynchronously"""
         def worker():
-            self._abort_flag.clear()
+            self._abort = False
             self._set_state(MIGState.DUMPING)
             
             total_size, trimmed_size = self._mig.get_xci_size()
@@ -352,19 +543,48 @@ class MIGController:
                 bytes_total=dump_size
             )
             
-            start_time = time.time()
+            start_time = time.monotonic()
             last_update = start_time
+            self._progress_pending.clear()
+            # Byte gate targeting ~500 updates per dump: the hot-path
+            # check is one predictable integer compare, with no float
+            # time math for the thousands of ticks that fall between
+            # thresholds.
+            gate_bytes = max(dump_size // 500, 1 << 20)
+            next_progress = gate_bytes
+            
+            # Hoisted once for the closure: bound methods resolve to
+            # LOAD_FAST cell loads per tick instead of LOAD_ATTR
+            # chains. self._abort stays a live attribute read — it is
+            # REBOUND by abort_dump, so capturing its current value
+            # here would never see the abort.
+            pending_is_set = self._progress_pending.is_set
+            pending_set = self._progress_pending.set
+            emit_progress = self._emit_progress
             
-            def on_progress(done: int, total: int):
-                nonlocal last_update
+            def on_progress(done: int, total: int, now: float):
+                # `now` is the dumper's own time.monotonic() reading,
+                # passed down so this hot path does no clock reads.
+                nonlocal last_update, next_progress
                 
-                # Check abort
-                if self._abort_flag.is_set():
+                # Check abort (GIL-atomic bool, see __init__)
+                if self._abort:
                     raise InterruptedError("Dump aborted")
                 
-                # Throttle updates
-                now = time.time()
-                if now - last_update < 0.1:
+                # Integer byte-threshold gate; the final tick always
+                # passes so the display reaches 100%.
+                if done < next_progress and done < total:
+                    return
+                next_progress = done + gate_bytes
+                
+                # Coalesce: while the GUI hasn't acknowledged the
+                # previous progress event (progress_event_handled)
+                # skip further ticks — unless it has been pending
+                # 500 ms (a stalled acknowledgment can't freeze the
+                # display) or this is the final tick, which must reach
+                # the display so it ends on 100%.
+                since_last = now - last_update
+                if done < total and pending_is_set() and since_last < 0.5:
                     return
                 last_update = now
                 
@@ -374,22 +594,21 @@ class MIGController:
                 remaining = total - done
                 eta = int(remaining / speed) if speed > 0 else 0
                 
-                self._emit_event(
-                    MIGEvent.DUMP_PROGRESS,
-                    f"{done / total * 100:.1f}%",
-                    progress=done / total * 100,
-                    bytes_done=done,
-                    bytes_total=total,
-                    speed_kbps=int(speed / 1024),
-                    eta_seconds=eta
-                )
+                # Integer tenths of a percent: (done * 1000) // total
+                # stays in int math, and "%d.%d%%" % divmod(...) beats
+                # an f-string float format on CPython. DUMP_PROGRESS
+                # carries the tenths value in `progress`; consumers
+                # divide by 10 once per displayed frame.
+                pct_tenths = (done * 1000) // total if total else 0
+                pending_set()
+                emit_progress(pct_tenths, done, total,
+                              int(speed / 1024), eta)
             
             try:
                 success = self.dump_xci(filename, trimmed, on_progress)
                 
                 if success:
-                    self._set_state(MIGState.AUTHENTICATED)
-                    self._emit_event(
+                    self._transition(MIGState.AUTHENTICATED,
                         MIGEvent.DUMP_COMPLETE,
                         f"Dump complete: {filename}",
                         bytes_done=dump_size,
@@ -400,92 +619,169 @@ class MIGController:
                     self._emit_event(MIGEvent.DUMP_ERROR, "Dump failed")
                     
             except InterruptedError:
-                self._set_state(MIGState.AUTHENTICATED)
-                self._emit_event(MIGEvent.DUMP_ERROR, "Dump aborted by user")
+                self._transition(MIGState.AUTHENTICATED,
+                                 MIGEvent.DUMP_ERROR, "Dump aborted by user")
                 
             except Exception as e:
-                self._set_state(MIGState.ERROR)
-                self._emit_event(MIGEvent.DUMP_ERROR, str(e), error=e)
+                self._transition(MIGState.ERROR, MIGEvent.DUMP_ERROR,
+                                 str(e), error=e)
         
-        self._worker_thread = threading.Thread(target=worker, daemon=True)
-        self._worker_thread.start()
+        self._future = self._executor.submit(worker)
     
     def abort_dump(self):
         """Abort ongoing dump operation"""
-        self._abort_flag.set()
+        self._abort = True
+    
+    def progress_event_handled(self):
+        """Acknowledge that the last DUMP_PROGRESS event was applied.
+        
+        GUIs call this after updating their progress display; until
+        then the dump emits no further progress events (beyond the
+        500 ms safety refresh), so a busy event loop receives a few
+        coalesced updates instead of a backlog.
+        """
+        self._progress_pending.clear()
     
     #-------------------------------------------------------------------------
     # DEVICE MONITORING
     #-------------------------------------------------------------------------
     
-    def start_monitoring(self, interval: float = 1.0):
+    # Per-state CEILING on the adaptive poll interval: the wait after a
+    # change starts at _MONITOR_MIN and doubles its distance from the
+    # last observed change (exponential backoff), but never exceeds the
+    # ceiling for the current state — fast while a cart is present (the
+    # user is probably about to act on it), relaxed when connected but
+    # empty, very slow while disconnected. Unlisted states cap at the
+    # connected-idle rate.
+    _MONITOR_CAPS = {
+        MIGState.CART_DETECTED: 0.25,
+        MIGState.AUTHENTICATING: 0.25,
+        MIGState.AUTHENTICATED: 0.25,
+        MIGState.DUMPING: 0.25,
+        MIGState.DISCONNECTED: 5.0,
+    }
+    _MONITOR_CAP_DEFAULT = 2.0
+    _MONITOR_MIN = 0.1
+
+    def start_monitoring(self, interval: Optional[float] = None):
         """
         Start monitoring for device/cartridge changes.
-        
+
         Periodically checks for:
         - Device connection/disconnection
         - Cartridge insertion/removal
+
+        With interval=None (default) the poll rate adapts with
+        exponential backoff: 100 ms right after an observed change
+        (when follow-up activity is likely), then the wait grows as
+        half the time since the last change, capped per state by
+        _MONITOR_CAPS. Steady-state USB probe traffic drops by an
+        order of magnitude versus a fixed 1 s poll while changes are
+        still noticed promptly. Passing a float pins a fixed rate.
+        Events fire only on actual state changes, and the sleep is an
+        Event wait so stop_monitoring cancels immediately instead of
+        draining a full sleep.
         """
         if self._monitoring:
             return
-        
+
         self._monitoring = True
-        
+        self._monitor_stop.clear()
+
         def monitor():
             was_connected = self.is_connected
             had_cart = False
-            
-            if was_connected and self._mig:
-                had_cart = self._mig.cart_inserted
-            
-            while self._monitoring:
-                time.sleep(interval)
-                
+            last_change = time.monotonic()
+
+            snap = self._cache
+            if was_connected and snap.mig:
+                had_cart = snap.mig.cart_inserted
+
+            def next_wait() -> float:
+                if interval is not None:
+                    return interval
+                cap = self._MONITOR_CAPS.get(self._state,
+                                             self._MONITOR_CAP_DEFAULT)
+                idle = time.monotonic() - last_change
+                return min(cap, max(self._MONITOR_MIN, idle * 0.5))
+
+            while not self._monitor_stop.wait(next_wait()):
+                # One snapshot read per wake: every field seen below
+                # belongs to the same consistent state.
+                snap = self._cache
                 try:
                     # Check connection
-                    is_connected = self.is_connected
+                    mig = snap.mig
+                    is_connected = mig is not None and mig.is_connected
                     
                     if was_connected and not is_connected:
                         # Lost connection
-                        self._set_state(MIGState.DISCONNECTED)
-                        self._emit_event(MIGEvent.DEVICE_DISCONNECTED, "Device disconnected")
+                        self._transition(MIGState.DISCONNECTED,
+                                         MIGEvent.DEVICE_DISCONNECTED,
+                                         "Device disconnected")
                         was_connected = False
                         had_cart = False
+                        last_change = time.monotonic()
                         continue
                     
                     if not is_connected:
                         continue
                     
+                    # While a dump owns the device, don't probe: the
+                    # header read would interleave a seek into the
+                    # dump's sequential stream, and a removal surfaces
+                    # as a dump I/O error immediately anyway. Outside
+                    # dumps the probe result is TTL-cached by MIGFlash,
+                    # so a wake shortly after a real operation costs no
+                    # extra USB traffic at all.
+                    if self._state == MIGState.DUMPING:
+                        continue
+                    
                     # Check cartridge
-                    has_cart = self._mig.cart_inserted
+                    has_cart = mig.cart_inserted
                     
                     if not had_cart and has_cart:
                         # Cart inserted
-                        self._set_state(MIGState.CART_DETECTED)
-                        self._emit_event(MIGEvent.CART_INSERTED, "Cartridge inserted")
+                        self._transition(MIGState.CART_DETECTED,
+                                         MIGEvent.CART_INSERTED,
+                                         "Cartridge inserted")
+                        last_change = time.monotonic()
                     
                     elif had_cart and not has_cart:
                         # Cart removed
-                        self._set_state(MIGState.NO_CART)
-                        self._cart_info = None
-                        self._xci_header = None
-                        self._emit_event(MIGEvent.CART_REMOVED, "Cartridge removed")
+                        self._update_cache(cart_info=None,
+                                           xci_header=None)
+                        self._transition(MIGState.NO_CART,
+                                         MIGEvent.CART_REMOVED,
+                                         "Cartridge removed")
+                        last_change = time.monotonic()
                     
                     was_connected = is_connected
                     had_cart = has_cart
                     
+                except OSError:
+                    # A yanked device can fail the probe mid-I/O; the
+                    # next wake observes the disconnect. Logic races
+                    # need no guard — the snapshot is consistent.
+                    pass
                 except Exception:
-                    pass  # Ignore monitoring errors
+                    # _transition delivers into the consumer's event
+                    # callback; a bug there must degrade that one
+                    # notification, never kill the monitor thread.
+                    pass
         
         self._monitor_thread = threading.Thread(target=monitor, daemon=True)
         self._monitor_thread.start()
     
     def stop_monitoring(self):
         """Stop device monitoring"""
-        self._monitoring = False
+        self._monitor_stop.set()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
             self._monitor_thread = None
+        # Cleared only after the join: _maybe_lock must keep handing
+        # out the real lock while the monitor thread can still run.
+        self._monitoring = False
     
     #-------------------------------------------------------------------------
     # CLEANUP
@@ -495,6 +791,8 @@ class MIGController:
         """Clean up resources"""
         self.stop_monitoring()
         self.disconnect()
+        self._update_cache(mig=None)
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 #=============================================================================
@@ -515,6 +813,30 @@ def example_tkinter_gui():
             self.controller = MIGController()
             self.controller.set_event_callback(self.on_event)
             
+            # Events cross from the worker thread via one queue; a
+            # drain pass is scheduled at most once per burst through
+            # after_idle, guarded by a GIL-atomic flag. No periodic
+            # timer ticks while idle, no per-event closures, and a
+            # burst of events costs one main-loop wakeup.
+            self._ev_queue: queue.SimpleQueue = queue.SimpleQueue()
+            self._drain_scheduled = False
+            
+            # O(1) event dispatch instead of an if/elif cascade over
+            # MIGEvent; events without an entry (AUTH_STARTED,
+            # DUMP_STARTED, ...) are ignored, as before.
+            self._handlers = {
+                MIGEvent.DEVICE_CONNECTED: self._on_connected,
+                MIGEvent.DEVICE_DISCONNECTED: self._on_disconnected,
+                MIGEvent.CART_INSERTED: self._on_cart_inserted,
+                MIGEvent.CART_REMOVED: self._on_cart_removed,
+                MIGEvent.AUTH_SUCCESS: self._on_auth_success,
+                MIGEvent.AUTH_FAILED: self._on_auth_failed,
+                MIGEvent.DUMP_PROGRESS: self._on_dump_progress,
+                MIGEvent.DUMP_COMPLETE: self._on_dump_complete,
+                MIGEvent.DUMP_ERROR: self._on_error_box,
+                MIGEvent.ERROR: self._on_error_box,
+            }
+            
             # GUI Elements
             self.create_widgets()
             
@@ -559,52 +881,80 @@ def example_tkinter_gui():
         
         def on_event(self, event: MIGEventData):
             """Handle events from controller (called from worker thread)"""
-            # Schedule GUI update on main thread
-            self.root.after(0, lambda: self.handle_event(event))
+            # The event object is recycled once this callback returns —
+            # snapshot the needed fields into a tuple of primitives
+            # before handing them to the drain pass.
+            self._ev_queue.put((event.event, event.message, event.progress,
+                                event.speed_kbps, event.data))
+            # Wake the main loop once per burst: the flag is cleared
+            # by _drain_events BEFORE it empties the queue, so a put
+            # landing mid-drain can never be stranded without a
+            # scheduled pass.
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.root.after_idle(self._drain_events)
         
-        def handle_event(self, event: MIGEventData):
-            """Process event on main thread"""
-            
-            if event.event == MIGEvent.DEVICE_CONNECTED:
-                self.status_label['text'] = f"Connected: {self.controller.firmware_version}"
-                self.connect_btn['text'] = "Disconnect"
-                
-            elif event.event == MIGEvent.DEVICE_DISCONNECTED:
-                self.status_label['text'] = "Disconnected"
-                self.connect_btn['text'] = "Connect"
-                self.auth_btn['state'] = 'disabled'
-                self.dump_btn['state'] = 'disabled'
-                
-            elif event.event == MIGEvent.CART_INSERTED:
-                self.cart_label['text'] = "Cartridge detected"
-                self.auth_btn['state'] = 'normal'
-                
-            elif event.event == MIGEvent.CART_REMOVED:
-                self.cart_label['text'] = "No cartridge"
-                self.auth_btn['state'] = 'disabled'
-                self.dump_btn['state'] = 'disabled'
-                
-            elif event.event == MIGEvent.AUTH_SUCCESS:
-                self.cart_label['text'] = f"Authenticated - {event.data.size / (1024**3):.1f} GB"
-                self.dump_btn['state'] = 'normal'
-                
-            elif event.event == MIGEvent.AUTH_FAILED:
-                messagebox.showerror("Error", f"Authentication failed: {event.message}")
-                
-            elif event.event == MIGEvent.DUMP_PROGRESS:
-                self.progress['value'] = event.progress
-                self.progress_label['text'] = f"{event.progress:.1f}% - {event.speed_kbps} KB/s"
-                
-            elif event.event == MIGEvent.DUMP_COMPLETE:
-                self.progress['value'] = 100
-                self.progress_label['text'] = "Complete!"
-                messagebox.showinfo("Success", event.message)
-                
-            elif event.event == MIGEvent.DUMP_ERROR:
-                messagebox.showerror("Error", event.message)
-                
-            elif event.event == MIGEvent.ERROR:
-                messagebox.showerror("Error", event.message)
+        def _drain_events(self):
+            """Service all pending controller events in one Tk pass"""
+            self._drain_scheduled = False
+            q = self._ev_queue
+            while True:
+                try:
+                    snap = q.get_nowait()
+                except queue.Empty:
+                    break
+                self.handle_event(*snap)
+        
+        def handle_event(self, ev: MIGEvent, message: str, progress: float,
+                         speed_kbps: int, data: Any):
+            """Process event on main thread (O(1) dispatch-table lookup)"""
+            handler = self._handlers.get(ev)
+            if handler:
+                handler(message, progress, speed_kbps, data)
+        
+        def _on_connected(self, message, progress, speed_kbps, data):
+            self.status_label['text'] = f"Connected: {self.controller.firmware_version}"
+            self.connect_btn['text'] = "Disconnect"
+        
+        def _on_disconnected(self, message, progress, speed_kbps, data):
+            self.status_label['text'] = "Disconnected"
+            self.connect_btn['text'] = "Connect"
+            self.auth_btn['state'] = 'disabled'
+            self.dump_btn['state'] = 'disabled'
+        
+        def _on_cart_inserted(self, message, progress, speed_kbps, data):
+            self.cart_label['text'] = "Cartridge detected"
+            self.auth_btn['state'] = 'normal'
+        
+        def _on_cart_removed(self, message, progress, speed_kbps, data):
+            self.cart_label['text'] = "No cartridge"
+            self.auth_btn['state'] = 'disabled'
+            self.dump_btn['state'] = 'disabled'
+        
+        def _on_auth_success(self, message, progress, speed_kbps, data):
+            self.cart_label['text'] = f"Authenticated - {data.size / (1024**3):.1f} GB"
+            self.dump_btn['state'] = 'normal'
+        
+        def _on_auth_failed(self, message, progress, speed_kbps, data):
+            messagebox.showerror("Error", f"Authentication failed: {message}")
+        
+        def _on_dump_progress(self, message, progress, speed_kbps, data):
+            # `progress` is integer tenths of a percent (0..1000).
+            # Hot handler: hoist the two widgets into locals once.
+            bar = self.progress
+            label = self.progress_label
+            bar['value'] = progress / 10
+            label['text'] = \
+                "%d.%d%% - %d KB/s" % (*divmod(progress, 10), speed_kbps)
+            self.controller.progress_event_handled()
+        
+        def _on_dump_complete(self, message, progress, speed_kbps, data):
+            self.progress['value'] = 100
+            self.progress_label['text'] = "Complete!"
+            messagebox.showinfo("Success", message)
+        
+        def _on_error_box(self, message, progress, speed_kbps, data):
+            messagebox.showerror("Error", message)
         
         def on_connect(self):
             if self.controller.is_connected:
@@ -14,10 +14,19 @@ Usage:
 """
 
 import struct
-from dataclasses import dataclass
-from typing import Optional, List, Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Optional, List, Callable
 from enum import IntEnum
 
+# Precompiled header-field readers — struct.unpack with a literal format
+# re-parses the format string on every call; Struct objects parse it once
+# at module load.
+_u32 = struct.Struct('<I')
+# The NCSD partition table is 8 (offset, size) pairs of u32 — one wide
+# unpack instead of 16 single-field calls.
+_ncsd_parts = struct.Struct('<16I')
+
 # Constants
 SLOT_3DS = 0x09
 CTR_MEDIA_UNIT_SIZE = 0x200
@@ -58,29 +67,41 @@ class CtrNCSDHeader:
     size: int
     media_id: bytes
     partitions: List[CtrPartitionInfo]
+    # Index → partition lookup, derived from `partitions` on construction
+    # so dumps that walk partitions repeatedly get O(1) access.
+    partitions_by_index: Dict[int, CtrPartitionInfo] = field(
+        init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.partitions_by_index = {p.index: p for p in self.partitions}
     
     @property
     def size_bytes(self) -> int:
         return self.size * CTR_MEDIA_UNIT_SIZE
     
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'CtrNCSDHeader':
-        magic = data[0x100:0x104]
-        size = struct.unpack('<I', data[0x104:0x108])[0]
-        media_id = data[0x108:0x110]
+    def from_bytes(cls, data) -> 'CtrNCSDHeader':
+        # Accepts bytes, bytearray or memoryview (e.g. a reused read
+        # buffer). Stored byte fields are copied out explicitly so the
+        # header never aliases a caller buffer that gets overwritten.
+        magic = bytes(data[0x100:0x104])
+        size = _u32.unpack_from(data, 0x104)[0]
+        media_id = bytes(data[0x108:0x110])
         
+        part_table = _ncsd_parts.unpack_from(data, 0x120)
+        fs_types = data[0x110:0x118]
+        crypt_flags = data[0x118:0x120]
         partitions = []
         for i in range(8):
-            offset = 0x120 + i * 8
-            part_offset = struct.unpack('<I', data[offset:offset+4])[0]
-            part_size = struct.unpack('<I', data[offset+4:offset+8])[0]
+            part_offset = part_table[2 * i]
+            part_size = part_table[2 * i + 1]
             if part_size > 0:
                 partitions.append(CtrPartitionInfo(
                     index=i,
                     offset=part_offset * CTR_MEDIA_UNIT_SIZE,
                     size=part_size * CTR_MEDIA_UNIT_SIZE,
-                    fs_type=data[0x110 + i],
-                    encrypted=(data[0x118 + i] != 0)
+                    fs_type=fs_types[i],
+                    encrypted=(crypt_flags[i] != 0)
                 ))
         
         return cls(magic=magic, size=size, media_id=media_id, partitions=partitions)
@@ -89,7 +110,7 @@ class CtrNCSDHeader:
 class CtrNCCHHeader:
     magic: bytes
     content_size: int
-    product_code: str
+    product_code_raw: bytes
     maker_code: bytes
     exefs_offset: int
     exefs_size: int
@@ -97,18 +118,27 @@ class CtrNCCHHeader:
     romfs_size: int
     flags: bytes
     
+    @cached_property
+    def product_code(self) -> str:
+        """Decoded product code — computed on first access only.
+        
+        Size/offset-only consumers (trimmed dump-size math) never pay
+        for the ASCII decode.
+        """
+        return self.product_code_raw.rstrip(b'\x00').decode('ascii')
+    
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'CtrNCCHHeader':
+    def from_bytes(cls, data) -> 'CtrNCCHHeader':
         return cls(
-            magic=data[0x100:0x104],
-            content_size=struct.unpack('<I', data[0x104:0x108])[0],
-            product_code=data[0x150:0x160].decode('ascii').rstrip('\x00'),
-            maker_code=data[0x110:0x112],
-            exefs_offset=struct.unpack('<I', data[0x1A0:0x1A4])[0],
-            exefs_size=struct.unpack('<I', data[0x1A4:0x1A8])[0],
-            romfs_offset=struct.unpack('<I', data[0x1B0:0x1B4])[0],
-            romfs_size=struct.unpack('<I', data[0x1B4:0x1B8])[0],
-            flags=data[0x188:0x190]
+            magic=bytes(data[0x100:0x104]),
+            content_size=_u32.unpack_from(data, 0x104)[0],
+            product_code_raw=bytes(data[0x150:0x160]),
+            maker_code=bytes(data[0x110:0x112]),
+            exefs_offset=_u32.unpack_from(data, 0x1A0)[0],
+            exefs_size=_u32.unpack_from(data, 0x1A4)[0],
+            romfs_offset=_u32.unpack_from(data, 0x1B0)[0],
+            romfs_size=_u32.unpack_from(data, 0x1B4)[0],
+            flags=bytes(data[0x188:0x190])
         )
 
 @dataclass
@@ -140,11 +170,11 @@ class Ctr3DSCartridge:
     def read_ncch(self, partition: int = 0) -> CtrNCCHHeader:
         if self._ncsd is None:
             self.read_ncsd()
-        for part in self._ncsd.partitions:
-            if part.index == partition:
-                data = self.device.read_rom(part.offset, CTR_NCCH_HEADER_SIZE)
-                return CtrNCCHHeader.from_bytes(data)
-        raise ValueError(f"Partition {partition} not found")
+        part = self._ncsd.partitions_by_index.get(partition)
+        if part is None:
+            raise ValueError(f"Partition {partition} not found")
+        data = self.device.read_rom(part.offset, CTR_NCCH_HEADER_SIZE)
+        return CtrNCCHHeader.from_bytes(data)
     
     def get_info(self) -> Ctr3DSInfo:
         ncsd = self.read_ncsd()
@@ -168,15 +198,23 @@ class Ctr3DSCartridge:
         else:
             dump_size = ncsd.size_bytes
         
-        chunk_size = 1024 * 1024
+        # 4 MiB chunks: ROM reads cost per-request latency on the USB
+        # link, so fewer, larger transfers dominate small ones.
+        chunk_size = 4 * 1024 * 1024
         with open(filename, 'wb') as f:
+            # Bind the loop's bound methods once: LOAD_FAST per
+            # iteration instead of LOAD_ATTR chains, which adds up over
+            # GB-scale dumps.
+            _read = self.device.read_rom
+            _write = f.write
+            _cb = progress_callback
             offset = 0
             while offset < dump_size:
                 read_size = min(chunk_size, dump_size - offset)
-                data = self.device.read_rom(offset, read_size)
-                f.write(data)
+                data = _read(offset, read_size)
+                _write(data)
                 offset += len(data)
-                if progress_callback and not progress_callback(offset, dump_size):
+                if _cb and not _cb(offset, dump_size):
                     raise InterruptedError("Dump aborted")
 
 def format_size(size_bytes: int) -> str:
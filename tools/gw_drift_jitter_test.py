@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+gw_drift_jitter_test.py — Greaseweazle spindle drift + jitter probe.
+
+Captures the same track repeatedly via the `gw read` host tool and
+compares the per-revolution index times stored in the resulting SCP
+files. Two numbers fall out:
+
+  drift  — slow change of the mean revolution time across passes
+           (belt stretch, motor warm-up, PSU sag)
+  jitter — spread of revolution times WITHIN one pass
+           (bearing noise, index-sensor slop)
+
+Both matter for flux forensics: UFT's multi-rev fusion weights
+revolutions by timing quality, and a drive with > ~0.3% jitter is a bad
+donor for weak-bit/protection captures. This tool answers "is this
+drive good enough?" before a long archival session.
+
+SCP layout read here (matches include/uft/flux/uft_scp_parser.h):
+  0x00  "SCP" magic, u8 version, u8 disk_type, u8 nr_revolutions
+  0x10  168 × u32 LE track-data-header offsets (0 = track absent)
+  TDH:  "TRK" + u8 track_no, then nr_revolutions × 3 u32 LE
+        (index_time [25 ns units], track_length, data_offset)
+
+Dependencies:
+  gw (greaseweazle host tools) on PATH for capture mode.
+  numpy is optional — the table reads vectorize through np.frombuffer
+  when available and fall back to struct unpacking otherwise.
+
+Usage:
+  python tools/gw_drift_jitter_test.py --device /dev/ttyACM0 --passes 5 --revs 5
+  python tools/gw_drift_jitter_test.py --parse-only capture1.scp capture2.scp
+"""
+from __future__ import annotations
+import argparse
+import mmap
+import statistics
+import struct
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:          # struct fallback below keeps the tool stdlib-only
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(**_kwargs):
+        """numba absent: leave the scan functions as plain Python."""
+        def deco(fn):
+            return fn
+        return deco
+
+SCP_MAGIC = b"SCP"
+SCP_MAX_TRACKS = 168
+SCP_TRACK_TABLE_OFF = 0x10
+SCP_TICK_NS = 25             # 40 MHz SCP sample clock
+
+# Fixed-size track table decoded with one precompiled wide Struct on the
+# non-numpy path (the rev table varies with nr_revs and is built per call).
+_scp_table_struct = struct.Struct(f"<{SCP_MAX_TRACKS}I")
+
+
+# The scan loops below are kept as free functions over flat u4 arrays so
+# numba can compile them when installed (cache=True persists the
+# compilation across runs). Today they only walk the small header
+# tables; a future flux-stream decode drops into the same shape and
+# inherits the jit for free. Without numba they run as plain Python
+# over numpy arrays, which is still fine at table sizes.
+
+@njit(cache=True)
+def _first_track_offset(track_offsets) -> int:
+    """First nonzero entry of the 168-slot track table (0 = none)."""
+    for i in range(track_offsets.shape[0]):
+        if track_offsets[i] != 0:
+            return track_offsets[i]
+    return 0
+
+
+@njit(cache=True)
+def _collect_index_ticks(rev_words, nr_revs, out) -> int:
+    """Gather nonzero index times (every 3rd u32) into out; returns count."""
+    n = 0
+    for r in range(nr_revs):
+        t = rev_words[3 * r]
+        if t != 0:
+            out[n] = t
+            n += 1
+    return n
+
+
+def parse_scp_index_times(path) -> list[int]:
+    """Return the per-revolution index times (ns) of the first track
+    present in an SCP file.
+
+    The track table (168 u32) and the revolution table (nr_revs × 3 u32)
+    are each read with ONE vectorized np.frombuffer call instead of
+    per-entry struct.unpack_from — one C-level copy per table versus
+    hundreds of Python-level unpack calls.
+
+    The file is mmap'd rather than read whole: an SCP with full flux
+    data runs to many MB, but this function only touches the header and
+    the two small tables, so the kernel faults in a handful of pages
+    instead of copying the entire file into a bytes object. Matters
+    when --parse-only sweeps a directory of captures.
+    """
+    with open(path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return _parse_index_times(path, data)
+
+
+def _parse_index_times(path, data) -> list[int]:
+    if data[0:3] != SCP_MAGIC:
+        raise ValueError(f"{path}: not an SCP file (bad magic)")
+    nr_revs = data[0x05]
+    if nr_revs == 0:
+        raise ValueError(f"{path}: header declares 0 revolutions")
+
+    if np is not None:
+        track_offsets = np.frombuffer(data, dtype="<u4",
+                                      count=SCP_MAX_TRACKS,
+                                      offset=SCP_TRACK_TABLE_OFF)
+        t_off = int(_first_track_offset(track_offsets))
+        if t_off == 0:
+            raise ValueError(f"{path}: no tracks in track table")
+        # Rev table: nr_revs rows of (index_time, track_length, data_offset).
+        rev_words = np.frombuffer(data, dtype="<u4", count=3 * nr_revs,
+                                  offset=t_off + 4)
+        out = np.empty(nr_revs, dtype=np.uint32)
+        n = _collect_index_ticks(rev_words, nr_revs, out)
+        return [int(t) * SCP_TICK_NS for t in out[:n]]
+
+    # Fallback without numpy: still one wide unpack per table — a single
+    # Struct call hands back a tuple of all entries at C speed, instead
+    # of SCP_MAX_TRACKS (resp. nr_revs) Python-level unpack_from calls.
+    track_offsets = _scp_table_struct.unpack_from(data, SCP_TRACK_TABLE_OFF)
+    t_off = next((off for off in track_offsets if off), 0)
+    if not t_off:
+        raise ValueError(f"{path}: no tracks in track table")
+    rev_words = struct.unpack_from(f"<{3 * nr_revs}I", data, t_off + 4)
+    # index_time is every 3rd word; zeros mark unused revolution slots.
+    return [t * SCP_TICK_NS for t in rev_words[::3] if t]
+
+
+def stats(vals) -> dict:
+    """Mean/stdev/min/max over revolution times (ns).
+
+    With numpy the four aggregates run as C loops over one float64
+    array — for the default 5 revs that is noise, but long drift
+    studies (hundreds of revs per pass) stay cheap.
+    """
+    if np is not None:
+        a = np.asarray(vals, dtype=np.float64)
+        return {
+            "mean": float(a.mean()),
+            "stdev": float(a.std()),
+            "min": float(a.min()),
+            "max": float(a.max()),
+        }
+    return {
+        "mean": statistics.mean(vals),
+        "stdev": statistics.pstdev(vals),
+        "min": min(vals),
+        "max": max(vals),
+    }
+
+
+def rpm(index_time_ns: float) -> float:
+    return 60e9 / index_time_ns if index_time_ns else 0.0
+
+
+def capture_pass(device: str | None, track: int, revs: int,
+                 out: Path) -> None:
+    """Run one `gw read` capture of a single track into `out`."""
+    cmd = ["gw", "read", "--tracks", f"c={track}:h=0", "--revs", str(revs),
+           str(out)]
+    if device:
+        cmd[2:2] = ["--device", device]
+    r = subprocess.run(cmd, capture_output=True, text=True)
+    if r.returncode != 0:
+        raise RuntimeError(f"gw read failed (pass → {out}):\n{r.stderr}")
+
+
+def report_pass(label: str, times: list[int]) -> dict:
+    s = stats(times)
+    print(f"{label}: mean {s['mean'] / 1e6:9.4f} ms "
+          f"({rpm(s['mean']):7.2f} RPM)  "
+          f"jitter ±{s['stdev'] / 1e3:7.2f} µs  "
+          f"pk-pk {(s['max'] - s['min']) / 1e3:7.2f} µs")
+    return s
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Measure spindle drift + jitter via repeated gw captures")
+    p.add_argument("--device", help="Greaseweazle serial device")
+    p.add_argument("--track", type=int, default=0, help="Cylinder to sample")
+    p.add_argument("--revs", type=int, default=5,
+                   help="Revolutions per capture pass")
+    p.add_argument("--passes", type=int, default=5, help="Capture passes")
+    p.add_argument("--keep", action="store_true",
+                   help="Keep the per-pass SCP files")
+    p.add_argument("--parse-only", nargs="+", metavar="SCP",
+                   help="Skip capture; analyze existing SCP files")
+    args = p.parse_args()
+
+    pass_means = []
+    if args.parse_only:
+        for path in args.parse_only:
+            s = report_pass(path, parse_scp_index_times(path))
+            pass_means.append(s["mean"])
+    else:
+        # Two-stage pipeline: while `gw read` for pass n+1 blocks on the
+        # hardware, a worker thread parses the SCP from pass n. Each
+        # pass gets its own output file so capture and parse never
+        # touch the same path.
+        def finish(pending):
+            n, fut = pending
+            s = report_pass(f"pass {n + 1}/{args.passes}", fut.result())
+            pass_means.append(s["mean"])
+            if not args.keep:
+                Path(f"gw_test_{n}.scp").unlink(missing_ok=True)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = None
+            for n in range(args.passes):
+                out = Path(f"gw_test_{n}.scp")
+                capture_pass(args.device, args.track, args.revs, out)
+                if pending is not None:
+                    finish(pending)
+                pending = (n, pool.submit(parse_scp_index_times, out))
+            if pending is not None:
+                finish(pending)
+
+    if len(pass_means) > 1:
+        drift = (max(pass_means) - min(pass_means)) / min(pass_means)
+        print(f"drift across passes: {drift * 100:.4f}% "
+              f"({rpm(pass_means[0]):.2f} → {rpm(pass_means[-1]):.2f} RPM)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+gw_stats.py — poll a Greaseweazle's GET_INFO block at a fixed rate.
+
+Companion to tools/greaseweazle_sim.py (same [CMD, LEN, payload...]
+framing, same 32-byte info-block layout) and to the production C-HAL in
+src/hal/uft_greaseweazle_full.c. Useful for watching a board during
+long captures: firmware/model stay constant, but the sample-frequency
+field doubles as a quick "is the MCU clock sane" check, and a dropped
+reply pinpoints a flaky USB-CDC link.
+
+The receive path deliberately bypasses pyserial: its read() degrades to
+per-byte reads on several platforms, which dominates CDC-ACM cost at
+polling rates. Instead the port is opened raw via termios and replies
+are accumulated with select + readv into one persistent buffer — one
+syscall per wakeup, no per-read allocation.
+
+POSIX-only (termios). For bench work on Windows use the simulator pair
+via com0com and run this side under WSL/socat.
+
+Usage:
+  python tools/gw_stats.py --port /dev/ttyACM0
+  python tools/gw_stats.py --port /dev/pts/14 --interval 0.5 --count 10
+"""
+from __future__ import annotations
+import argparse
+import os
+import select
+import struct
+import sys
+import termios
+import time
+
+ACK = 0
+
+CMD_GET_INFO = 0x00
+
+INFO_BLOCK_LEN = 32
+
+# Frame header and the fixed GET_INFO packet, packed once at module
+# load — the polling loop then writes a ready-made bytes object instead
+# of rebuilding list → bytes → concatenation every tick.
+_HDR = struct.Struct('<BB')
+_GETINFO_PKT = _HDR.pack(CMD_GET_INFO, 2)
+
+# Precompiled field reader for the info block — unpack_from with a
+# literal format would re-parse the format string on every poll.
+_u32 = struct.Struct('<I')
+
+# Reply buffer reused across polls: [cmd, status] + info block.
+_rx_buf = bytearray(2 + INFO_BLOCK_LEN)
+
+
+def open_port(path: str) -> int:
+    """Open the serial port raw (no echo, no line discipline)."""
+    fd = os.open(path, os.O_RDWR | os.O_NOCTTY)
+    attrs = termios.tcgetattr(fd)
+    # cfmakeraw equivalent
+    attrs[0] = 0                      # iflag
+    attrs[1] = 0                      # oflag
+    attrs[2] = (attrs[2] & ~(termios.CSIZE | termios.PARENB)) | termios.CS8
+    attrs[3] = 0                      # lflag
+    attrs[6][termios.VMIN] = 0
+    attrs[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    return fd
+
+
+def rx_exact(fd: int, n: int, timeout: float = 1.0) -> memoryview:
+    """Read exactly n bytes into the shared reply buffer.
+
+    select-gated readv calls accumulate directly into the persistent
+    bytearray — no per-byte reads, no intermediate bytes objects.
+    Returns a memoryview over the filled region.
+    """
+    mv = memoryview(_rx_buf)
+    deadline = time.monotonic() + timeout
+    got = 0
+    while got < n:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"short reply: {got}/{n} bytes")
+        r, _, _ = select.select([fd], [], [], remaining)
+        if not r:
+            continue
+        nread = os.readv(fd, [mv[got:n]])
+        if nread == 0:
+            raise ConnectionError("serial port closed")
+        got += nread
+    return mv[:n]
+
+
+def tx_cmd(fd: int, cmd: int, payload: bytes = b"") -> None:
+    """Send one [CMD, LEN, payload...] frame."""
+    if payload:
+        os.write(fd, _HDR.pack(cmd, 2 + len(payload)) + payload)
+    else:
+        os.write(fd, _HDR.pack(cmd, 2))
+
+
+def poll_info(fd: int) -> dict:
+    """One GET_INFO round-trip; returns the decoded info block."""
+    os.write(fd, _GETINFO_PKT)
+    reply = rx_exact(fd, 2 + INFO_BLOCK_LEN)
+    if reply[0] != CMD_GET_INFO or reply[1] != ACK:
+        raise IOError(f"bad reply header: cmd={reply[0]} status={reply[1]}")
+    info = reply[2:]
+    return {
+        "hw_model": info[0],
+        "hw_submodel": info[1],
+        "fw_major": info[2],
+        "fw_minor": info[3],
+        "sample_freq": _u32.unpack_from(info, 8)[0],
+    }
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Poll Greaseweazle GET_INFO at a fixed rate")
+    p.add_argument("--port", required=True,
+                   help="Serial port (e.g. /dev/ttyACM0, /dev/pts/14)")
+    p.add_argument("--interval", type=float, default=1.0,
+                   help="Seconds between polls")
+    p.add_argument("--count", type=int, default=0,
+                   help="Number of polls (0 = until Ctrl-C)")
+    args = p.parse_args()
+
+    fd = open_port(args.port)
+    n = 0
+    failures = 0
+    try:
+        while True:
+            t0 = time.monotonic()
+            try:
+                info = poll_info(fd)
+                rtt_ms = (time.monotonic() - t0) * 1e3
+                print(f"GW F{info['hw_model']}.{info['hw_submodel']} "
+                      f"fw {info['fw_major']}.{info['fw_minor']} "
+                      f"sample {info['sample_freq'] / 1e6:.1f} MHz "
+                      f"rtt {rtt_ms:6.2f} ms")
+            except (TimeoutError, IOError) as e:
+                failures += 1
+                print(f"poll failed: {e}", file=sys.stderr)
+            n += 1
+            if args.count and n >= args.count:
+                break
+            time.sleep(max(0.0, args.interval - (time.monotonic() - t0)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os.close(fd)
+    print(f"{n} polls, {failures} failures", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())